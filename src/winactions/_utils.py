@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import base64
 import json
 import platform
 from typing import Any, Tuple, TYPE_CHECKING
@@ -11,6 +12,11 @@ if TYPE_CHECKING or platform.system() == "Windows":
 else:
     RECT = Any
 
+try:
+    import pybase64
+except ImportError:  # optional speed-up, see the "fast" extra
+    pybase64 = None
+
 
 def is_json_serializable(obj: Any) -> bool:
     """Check if the object is JSON serializable.
@@ -25,6 +31,19 @@ def is_json_serializable(obj: Any) -> bool:
         return False
 
 
+def b64encode_str(data: Any) -> str:
+    """Base64-encode a bytes-like object into an ASCII str.
+
+    Uses pybase64's SIMD encoder when it is installed.
+
+    :param data: The bytes-like object (bytes, memoryview, ...) to encode.
+    :return: The base64 text.
+    """
+    if pybase64 is not None:
+        return pybase64.b64encode_as_string(data)
+    return base64.b64encode(data).decode("ascii")
+
+
 def coordinate_adjusted(window_rect: RECT, control_rect: RECT) -> Tuple:
     """Adjust control rectangle coordinates relative to the window rectangle.
 
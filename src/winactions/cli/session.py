@@ -18,6 +18,7 @@ from typing import Any, Dict, List, Optional, TYPE_CHECKING
 import psutil
 
 from winactions.config import get_action_config
+from winactions.control.controller import ControlReceiver
 from winactions.control.inspector import ControlInspectorFacade
 from winactions.perception.provider import UIAStateProvider
 from winactions.perception.state import UIState
@@ -278,6 +279,9 @@ class DesktopSession:
                 "No window focused. Use 'winctl focus <window>' or 'winctl windows' first."
             )
 
+        # Let a pending mouse_move land first: hover-dependent UI would be
+        # captured mid-move otherwise
+        ControlReceiver.sync_mouse()
         targets, controls = self.provider.detect(self.window)
         self._controls = controls
 
@@ -312,15 +316,16 @@ class DesktopSession:
 
             # Plain screenshot
             path = os.path.join(tmp_dir, "screenshot.png")
-            facade.capture_app_window_screenshot(self.window, save_path=path)
+            image = facade.capture_app_window_screenshot(self.window, save_path=path)
             self.state.screenshot_path = path
 
-            # Annotated screenshot
+            # Annotated screenshot, drawn on the same capture
             ann_path = os.path.join(tmp_dir, "annotated.png")
             facade.capture_app_window_screenshot_with_annotation(
                 self.window,
                 self._controls,
                 save_path=ann_path,
+                image=image,
             )
             self.state.annotated_screenshot_path = ann_path
         except ImportError:
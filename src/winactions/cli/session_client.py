@@ -12,9 +12,11 @@ import socket
 import subprocess
 import sys
 import time
-from typing import Optional
+from typing import List, Optional
 
 from winactions.cli.session_server import (
+    _json_dumps_line,
+    _json_loads,
     _recv_line,
     is_server_alive,
     read_pid_file,
@@ -24,16 +26,16 @@ from winactions.cli.session_server import (
 
 def send_command(port: int, request: dict, timeout: float = 30.0) -> dict:
     """Connect, send one JSON request, receive one JSON response, close."""
-    sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-    sock.settimeout(timeout)
     try:
-        sock.connect(("127.0.0.1", port))
-        payload = json.dumps(request).encode("utf-8") + b"\n"
-        sock.sendall(payload)
-        data = _recv_line(sock, timeout=timeout)
+        with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
+            sock.settimeout(timeout)
+            sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+            sock.connect(("127.0.0.1", port))
+            sock.sendall(_json_dumps_line(request))
+            data = _recv_line(sock, timeout=timeout)
         if data is None:
             return {"status": "error", "error": "No response from daemon"}
-        return json.loads(data)
+        return _json_loads(data)
     except socket.timeout:
         return {"status": "error", "error": "Daemon response timeout"}
     except ConnectionRefusedError:
@@ -42,11 +44,25 @@ def send_command(port: int, request: dict, timeout: float = 30.0) -> dict:
         return {"status": "error", "error": f"Invalid response JSON: {e}"}
     except OSError as e:
         return {"status": "error", "error": f"Connection error: {e}"}
-    finally:
-        try:
-            sock.close()
-        except OSError:
-            pass
+
+
+def send_command_batch(
+    port: int,
+    requests: List[dict],
+    *,
+    stop_on_error: bool = False,
+    timeout: float = 30.0,
+) -> dict:
+    """Send several requests in one round trip.
+
+    The response carries one entry per executed request under
+    ``results``; with *stop_on_error* execution ends at the first error.
+    """
+    return send_command(
+        port,
+        {"batch": list(requests), "stop_on_error": stop_on_error},
+        timeout=timeout,
+    )
 
 
 def ensure_server(
@@ -7,7 +7,9 @@ in-process calls.
 
 from __future__ import annotations
 
+import functools
 import logging
+import re
 import time
 from typing import Any, Callable, Dict, Optional
 
@@ -27,10 +29,14 @@ class SessionDispatch:
         default_infer: bool = False,
     ):
         self.session = session
-        self._default_vision = default_vision
-        self._default_infer = default_infer
-        self._current_vision = default_vision
-        self._current_infer = default_infer
+        self._default_sig = (default_vision, default_infer)
+        # (vision, infer) the session's provider was last built for
+        self._provider_sig = self._default_sig
+        # Providers already built per (vision, infer), so flipping a flag
+        # back reuses one (and its caches); seeded with the session's own.
+        self._providers: Dict[tuple, Any] = {
+            self._provider_sig: getattr(session, "provider", None)
+        }
         self._dispatch: Dict[str, Callable] = self._build_dispatch_table()
 
     # ------------------------------------------------------------------
@@ -39,6 +45,8 @@ class SessionDispatch:
 
     def handle(self, request: dict) -> dict:
         """Process a single request, return a response dict."""
+        if "batch" in request:
+            return self._handle_batch(request)
         command = request.get("command", "")
         args = request.get("args", {})
         flags = request.get("flags", {})
@@ -60,6 +68,29 @@ class SessionDispatch:
             logger.exception("Handler error for %s", command)
             return {"status": "error", "error": str(e), "command": command}
 
+    def _handle_batch(self, request: dict) -> dict:
+        """Run ``request["batch"]`` in order, one response per command.
+
+        With ``stop_on_error`` the batch ends at the first error response,
+        so ``results`` may be shorter than the batch.
+        """
+        batch = request["batch"]
+        if not isinstance(batch, list):
+            return {"status": "error", "error": "batch must be a list of requests"}
+        stop_on_error = request.get("stop_on_error", False)
+        results = []
+        for sub in batch:
+            if not isinstance(sub, dict) or "batch" in sub:
+                resp = {"status": "error", "error": "Invalid batch entry"}
+            elif sub.get("command") == "_shutdown":
+                resp = {"status": "error", "error": "_shutdown cannot be batched"}
+            else:
+                resp = self.handle(sub)
+            results.append(resp)
+            if stop_on_error and resp.get("status") == "error":
+                break
+        return {"status": "ok", "results": results}
+
     # ------------------------------------------------------------------
     # Dispatch table
     # ------------------------------------------------------------------
@@ -133,7 +164,9 @@ class SessionDispatch:
         if not path:
             fd, path = tempfile.mkstemp(suffix=".png", prefix="winctl_")
             os.close(fd)
+        from winactions.control.controller import ControlReceiver
         from winactions.screenshot.photographer import PhotographerFacade
+        ControlReceiver.sync_mouse()
         facade = PhotographerFacade()
         facade.capture_app_window_screenshot(self.session.window, save_path=path)
         return {"status": "ok", "result": {"path": path}}
@@ -430,15 +463,27 @@ class SessionDispatch:
 
     def _maybe_switch_provider(self, flags: dict) -> None:
         """Rebuild provider if vision/infer flags differ from current."""
-        want_vision = flags.get("vision", self._default_vision)
-        want_infer = flags.get("infer", self._default_infer)
-        if (want_vision, want_infer) != (self._current_vision, self._current_infer):
-            self._rebuild_provider(want_vision, want_infer)
-            self._current_vision = want_vision
-            self._current_infer = want_infer
+        if not flags and self._provider_sig == self._default_sig:
+            return  # common case: no overrides and already on the defaults
+        default_vision, default_infer = self._default_sig
+        sig = (flags.get("vision", default_vision), flags.get("infer", default_infer))
+        if sig != self._provider_sig:
+            self._rebuild_provider(*sig)
+            self._provider_sig = sig
 
     def _rebuild_provider(self, vision: bool, infer: bool) -> None:
-        """Rebuild the session's provider (mirrors session.py constructor logic)."""
+        """Switch the session to the provider for these flags, building it once."""
+        provider = self._providers.get((vision, infer))
+        if provider is None:
+            provider = self._build_provider(vision, infer)
+            self._providers[(vision, infer)] = provider
+        self.session.provider = provider
+
+        # Invalidate cached state since provider changed
+        self.session.state = None
+
+    def _build_provider(self, vision: bool, infer: bool) -> Any:
+        """Build a provider for the flags (mirrors session.py constructor logic)."""
         import os
         from winactions.perception.provider import UIAStateProvider
 
@@ -474,12 +519,8 @@ class SessionDispatch:
                 api_key=api_key,
                 base_url=base_url,
             )
-            self.session.provider = CompositeStateProvider(primary, vision_provider)
-        else:
-            self.session.provider = primary
-
-        # Invalidate cached state since provider changed
-        self.session.state = None
+            return CompositeStateProvider(primary, vision_provider)
+        return primary
 
     def _action_response(self, result: Any, flags: dict) -> dict:
         """Build response for action commands, optionally with fresh state."""
@@ -500,14 +541,19 @@ class SessionDispatch:
 # ======================================================================
 
 
+_MODIFIER_PREFIX_RE = re.compile(r"(?i)(ctrl|shift|alt)\+")
+_PYWINAUTO_FORMAT_RE = re.compile(r"[\\^%]|{.*}")
+
+
+# A daemon session sends the same handful of combos over and over, and the
+# result depends only on the input string, so memoize it.
+@functools.lru_cache(maxsize=256)
 def _translate_keys(keys_str: str) -> str:
     """Translate human-friendly key combos to pywinauto format.
 
     Examples: 'ctrl+a' -> '^a', 'alt+f4' -> '%{F4}', 'Enter' -> '{ENTER}'
     Handles mixed format: 'ctrl+a{DELETE}' -> '^a{DELETE}'
     """
-    import re
-
     # Extract leading human-friendly modifier prefixes (ctrl+, shift+, alt+)
     # BEFORE checking for pywinauto format markers.  This handles mixed
     # formats like "ctrl+a{DELETE}" where modifiers are human-friendly but
@@ -515,7 +561,7 @@ def _translate_keys(keys_str: str) -> str:
     remaining = keys_str
     modifiers = ""
     while True:
-        m = re.match(r"(?i)(ctrl|shift|alt)\+", remaining)
+        m = _MODIFIER_PREFIX_RE.match(remaining)
         if not m:
             break
         modifiers += {"ctrl": "^", "shift": "+", "alt": "%"}[
@@ -524,7 +570,7 @@ def _translate_keys(keys_str: str) -> str:
         remaining = remaining[m.end():]
 
     # If the remaining part is already in pywinauto format, prepend modifiers
-    if re.search(r"[\\^%]|{.*}", remaining):
+    if _PYWINAUTO_FORMAT_RE.search(remaining):
         return modifiers + remaining
 
     # Single character key with modifiers — done
@@ -14,7 +14,25 @@ import os
 import socket
 import sys
 import tempfile
-from typing import Optional
+import threading
+from typing import Any, Optional
+
+try:
+    import orjson
+except ImportError:  # optional speed-up, see the "fast" extra
+    orjson = None
+
+# orjson serializes datetimes/UUIDs/numpy natively; non-str keys mirror json;
+# the frame's newline terminator is written into the same output buffer
+_DUMP_OPTS = (
+    orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_APPEND_NEWLINE
+    if orjson is not None
+    else 0
+)
+
+# Fallback encoder, built once: json.dumps(default=...) constructs a new
+# JSONEncoder per call.  encode() keeps no state between calls.
+_JSON_ENCODER = json.JSONEncoder(default=str)
 
 from winactions.cli.session_dispatch import SessionDispatch
 
@@ -24,10 +42,43 @@ logger = logging.getLogger(__name__)
 _PORT_MIN = 49152
 _PORT_MAX = 65535
 
+# Pre-serialized liveness probe (sent on every is_server_alive call)
+_PING_REQUEST: bytes = b'{"command": "_ping"}\n'
+
+# Initial receive buffer; most frames (pings, action results) fit in one
+_RECV_BUFFER_SIZE = 64 * 1024
+
+# Safety limit for a single unterminated frame
+_MAX_LINE_BYTES = 1024 * 1024
+
+# Loopback connect either succeeds or is refused almost immediately
+_CONNECT_TIMEOUT = 0.1
+
+
+def _json_loads(data: bytes) -> Any:
+    """Decode a raw JSON frame; uses orjson when it is installed."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _json_dumps_line(obj: Any) -> bytes:
+    """Encode a newline-terminated frame; non-JSON types fall back to ``str()``."""
+    if orjson is not None:
+        try:
+            return orjson.dumps(obj, default=str, option=_DUMP_OPTS)
+        except TypeError:
+            pass  # e.g. integers beyond 64 bits — let json handle it
+    return (_JSON_ENCODER.encode(obj) + "\n").encode("utf-8")
+
 
 def session_port(name: str) -> int:
-    """Deterministic port from session name (49152–65535)."""
-    h = int(hashlib.sha256(name.encode()).hexdigest(), 16)
+    """Deterministic port from session name (49152–65535).
+
+    Only 14 bits of the hash are used, so a 2-byte BLAKE2b digest is
+    enough (65536 is a multiple of the range size: still uniform).
+    """
+    h = int.from_bytes(hashlib.blake2b(name.encode(), digest_size=2).digest(), "big")
     return _PORT_MIN + (h % (_PORT_MAX - _PORT_MIN + 1))
 
 
@@ -64,38 +115,29 @@ def remove_pid_file(name: str) -> None:
 
 
 def is_server_alive(name: str) -> bool:
-    """Check if a daemon is running: PID exists + TCP ping succeeds.
+    """Check if a daemon is running: TCP ping to the port in the PID file.
 
-    If the PID file exists but the process is dead, cleans up the stale
-    PID file and returns False.
+    The PID file is only consulted for the port.  A dead daemon shows up
+    as a refused loopback connect, so no separate process check is
+    needed.  On failure the stale PID file is cleaned up and False is
+    returned.
     """
     info = read_pid_file(name)
     if info is None:
         return False
 
-    pid = info.get("pid")
     port = info.get("port")
-    stored_name = info.get("session_name")
-
-    # Check if process is still alive
-    try:
-        import psutil
-        if not psutil.pid_exists(pid):
-            remove_pid_file(name)
-            return False
-    except ImportError:
-        pass  # If psutil is not available, fall through to TCP check
 
     # TCP ping to verify it's actually our server
     try:
-        sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-        sock.settimeout(2.0)
-        sock.connect(("127.0.0.1", port))
-        sock.sendall(json.dumps({"command": "_ping"}).encode("utf-8") + b"\n")
-        data = _recv_line(sock, timeout=2.0)
-        sock.close()
-        if data:
-            resp = json.loads(data)
+        with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
+            sock.settimeout(_CONNECT_TIMEOUT)
+            sock.connect(("127.0.0.1", port))
+            sock.settimeout(2.0)
+            sock.sendall(_PING_REQUEST)
+            data = _recv_line(sock, timeout=2.0)
+        resp = _json_loads(data) if data else None
+        if isinstance(resp, dict):
             # Verify session name matches (collision detection)
             if resp.get("session") and resp["session"] != name:
                 logger.warning(
@@ -104,14 +146,25 @@ def is_server_alive(name: str) -> bool:
                 )
                 return False
             return resp.get("status") == "ok"
-    except (OSError, json.JSONDecodeError, ValueError):
+    except (OSError, ValueError, TypeError):
+        # Nothing listening (ConnectionRefusedError), a timeout, or a
+        # reply that is not JSON (JSONDecodeError is a ValueError)
         pass
 
-    # Process exists but TCP failed — stale
+    # No valid ping reply — stale
     remove_pid_file(name)
     return False
 
 
+def _prewarm_annotations() -> None:
+    """Fill the annotation font/label caches ahead of the first screenshot."""
+    try:
+        from winactions.screenshot.photographer import AnnotationDecorator
+    except ImportError:
+        return  # Pillow not installed: screenshots are unavailable anyway
+    AnnotationDecorator.prewarm()
+
+
 class SessionServer:
     """Single-threaded TCP server for daemon mode."""
 
@@ -143,6 +196,11 @@ class SessionServer:
         except Exception:
             pass
 
+        # Off the accept loop: the first request must not wait for it
+        threading.Thread(
+            target=_prewarm_annotations, name="annotation-prewarm", daemon=True
+        ).start()
+
         try:
             while self._running:
                 try:
@@ -154,7 +212,8 @@ class SessionServer:
                 try:
                     self._handle_connection(conn)
                 except Exception as e:
-                    logger.exception("Error handling connection: %s", e)
+                    if logger.isEnabledFor(logging.ERROR):
+                        logger.exception("Error handling connection: %s", e)
                 finally:
                     try:
                         conn.close()
@@ -168,15 +227,18 @@ class SessionServer:
     def _handle_connection(self, conn: socket.socket) -> None:
         """Read one JSON line, dispatch, send response, close."""
         conn.settimeout(30.0)
+        # State responses span several segments; don't hold the last one
+        # back waiting on the client's delayed ACK.
+        conn.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
         data = _recv_line(conn, timeout=30.0)
         if not data:
             return
 
         try:
-            request = json.loads(data)
+            request = _json_loads(data)
         except json.JSONDecodeError as e:
             response = {"status": "error", "error": f"Invalid JSON: {e}"}
-            conn.sendall(json.dumps(response).encode("utf-8") + b"\n")
+            conn.sendall(_json_dumps_line(response))
             return
 
         response = self._dispatch.handle(request)
@@ -187,32 +249,42 @@ class SessionServer:
 
         # Check for shutdown
         if request.get("command") == "_shutdown":
-            conn.sendall(json.dumps(response).encode("utf-8") + b"\n")
+            conn.sendall(_json_dumps_line(response))
             self._running = False
             return
 
-        conn.sendall(json.dumps(response, default=str).encode("utf-8") + b"\n")
+        conn.sendall(_json_dumps_line(response))
 
     def shutdown(self) -> None:
         """Signal the server to stop."""
         self._running = False
 
 
-def _recv_line(sock: socket.socket, timeout: float = 30.0) -> Optional[str]:
-    """Receive a single newline-terminated line from a socket."""
+def _recv_line(sock: socket.socket, timeout: float = 30.0) -> Optional[bytes]:
+    """Receive a single newline-terminated line from a socket.
+
+    Returns the raw bytes up to (not including) the newline.  JSON
+    decoders accept bytes and ignore surrounding whitespace, so callers
+    can parse the frame without a decode/strip round-trip.
+    """
     sock.settimeout(timeout)
-    buf = b""
+    # Receive straight into one growing buffer and only scan the new
+    # bytes for the terminator: no per-chunk concatenation or re-scan.
+    buf = bytearray(_RECV_BUFFER_SIZE)
+    size = 0
     while True:
+        if size == len(buf):
+            buf.extend(bytes(size))  # double the capacity
         try:
-            chunk = sock.recv(4096)
+            n = sock.recv_into(memoryview(buf)[size:])
         except socket.timeout:
             return None
-        if not chunk:
+        if not n:
             # Connection closed
-            return buf.decode("utf-8").strip() if buf else None
-        buf += chunk
-        if b"\n" in buf:
-            line, _ = buf.split(b"\n", 1)
-            return line.decode("utf-8").strip()
-        if len(buf) > 1024 * 1024:  # 1 MB safety limit
+            return bytes(memoryview(buf)[:size]) or None
+        idx = buf.find(b"\n", size, size + n)
+        size += n
+        if idx != -1:
+            return bytes(memoryview(buf)[:idx])
+        if size > _MAX_LINE_BYTES:
             return None
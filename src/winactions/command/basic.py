@@ -4,35 +4,89 @@
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
-from typing import Dict, List, Type
+from collections import ChainMap
+from types import MappingProxyType
+from typing import Dict, Mapping, Optional, Tuple, Type
 
 
 class ReceiverBasic(ABC):
     """The abstract receiver interface."""
 
     _command_registry: Dict[str, Type[CommandBasic]] = {}
+    # Read-only view used for lookup: this class's registry first, then
+    # those of its receiver base classes
+    _command_lookup: Mapping[str, Type[CommandBasic]] = MappingProxyType(
+        _command_registry
+    )
+    # Command names of _command_lookup, rebuilt lazily after registration
+    _cached_names: Optional[Tuple[str, ...]] = None
+
+    def __init_subclass__(cls, **kwargs) -> None:
+        super().__init_subclass__(**kwargs)
+        # Every receiver class registers into its own dict; otherwise a
+        # subclass that does not redeclare it would register into its
+        # parent's.  Lookups still see the commands of receiver bases.
+        if "_command_registry" not in cls.__dict__:
+            cls._command_registry = {}
+        inherited = [
+            base.__dict__["_command_registry"]
+            for base in cls.__mro__[1:]
+            if issubclass(base, ReceiverBasic)
+            and base is not ReceiverBasic
+            and "_command_registry" in base.__dict__
+        ]
+        registry = cls._command_registry
+        cls._command_lookup = MappingProxyType(
+            ChainMap(registry, *inherited) if inherited else registry
+        )
+        cls._cached_names = None
+
+    @classmethod
+    def _invalidate_names(cls) -> None:
+        """Drop the cached command names of *cls* and every subclass."""
+        pending = [cls]
+        while pending:
+            klass = pending.pop()
+            klass._cached_names = None
+            pending.extend(klass.__subclasses__())
 
     @property
-    def command_registry(self) -> Dict[str, Type[CommandBasic]]:
-        return self._command_registry
+    def command_registry(self) -> Mapping[str, Type[CommandBasic]]:
+        return self._command_lookup
 
     def register_command(self, command_name: str, command: CommandBasic) -> None:
-        self.command_registry[command_name] = command
+        self._command_registry[command_name] = command
+        type(self)._invalidate_names()
 
     def list_commands(self):
-        return list(self.command_registry.keys())
+        return list(self.supported_command_names)
 
     @property
-    def supported_command_names(self) -> List[str]:
-        return list(self.command_registry.keys())
+    def supported_command_names(self) -> Tuple[str, ...]:
+        names = type(self)._cached_names
+        if names is None:
+            names = type(self)._cached_names = tuple(self.command_registry)
+        return names
 
     def self_command_mapping(self) -> Dict[str, CommandBasic]:
-        return {command_name: self for command_name in self.supported_command_names}
+        return dict.fromkeys(self.supported_command_names, self)
 
     @classmethod
     def register(cls, command_class: Type[CommandBasic]) -> Type[CommandBasic]:
-        """Decorator to register a command class."""
-        cls._command_registry[command_class.name()] = command_class
+        """Decorator to register a command class.
+
+        :raises ValueError: If another class is already registered under
+            the same command name.
+        """
+        name = command_class.name()
+        existing = cls._command_registry.get(name)
+        if existing is not None and existing is not command_class:
+            raise ValueError(
+                f"Command name {name!r} of {command_class.__name__} is already "
+                f"registered by {existing.__name__}."
+            )
+        cls._command_registry[name] = command_class
+        cls._invalidate_names()
         return command_class
 
     @property
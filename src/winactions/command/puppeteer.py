@@ -36,10 +36,10 @@ class AppPuppeteer:
         self, command_name: str, params: Dict[str, Any], *args, **kwargs
     ) -> Optional[CommandBasic]:
         receiver = self.receiver_manager.get_receiver_from_command_name(command_name)
-        command = receiver.command_registry.get(command_name.lower(), None)
-
         if receiver is None:
             raise ValueError(f"Receiver for command {command_name} is not found.")
+
+        command = receiver.command_registry.get(command_name.lower(), None)
         if command is None:
             raise ValueError(f"Command {command_name} is not supported.")
 
@@ -85,6 +85,8 @@ class AppPuppeteer:
 
     @staticmethod
     def get_command_string(command_name: str, params: Dict[str, str]) -> str:
+        if not params:
+            return f"{command_name}()"
         args_str = ", ".join(f"{k}={v!r}" for k, v in params.items())
         return f"{command_name}({args_str})"
 
@@ -13,7 +13,17 @@ class ActionConfig:
     input_text_api: str = "type_keys"
     input_text_enter: bool = False
     input_text_inter_key_pause: float = 0.05
+    # type_keys input pastes literal text at least this long via the
+    # clipboard instead of typing it key by key (0 disables).  Text with
+    # newlines, tabs or "{" (key names such as {ENTER}) is always typed,
+    # and so is any text while the clipboard holds non-text data (images,
+    # files, rich text), since only plain text is restored after a paste.
+    paste_threshold: int = 32
     pyautogui_failsafe: bool = False
+    pyautogui_pause: float = 0.0
+    # Skip pywinauto's wait for the system double-click interval before
+    # every click_input (up to ~500 ms per click).
+    disable_double_click_guard: bool = False
 
 
 # Module-level late-binding singleton
@@ -9,20 +9,38 @@ from UFO's global config system.
 
 import logging
 import platform
+import re
+import threading
 import time
 import warnings
 from abc import abstractmethod
-from typing import Any, Dict, List, Optional, Tuple, Type, Union, TYPE_CHECKING
+from typing import (
+    Any, Callable, Dict, List, Optional, Tuple, Type, Union, TYPE_CHECKING,
+)
+
+import psutil
 
 if TYPE_CHECKING or platform.system() == "Windows":
     import pyautogui
     import pywinauto
+    import pywinauto.findbestmatch
+    import pywinauto.timings
+    from comtypes import COMError
+    import win32api
+    import win32clipboard
+    import win32con
+    import win32gui
     from pywinauto import keyboard
     from pywinauto.controls.uiawrapper import UIAWrapper
     from pywinauto.win32structures import RECT
 else:
     pyautogui = None
     pywinauto = None
+    COMError = None
+    win32api = None
+    win32clipboard = None
+    win32con = None
+    win32gui = None
     keyboard = None
     UIAWrapper = Any
     RECT = Any
@@ -33,15 +51,27 @@ from winactions.config import get_action_config
 
 logger = logging.getLogger(__name__)
 
-_pywinauto_timings_initialized = False
+# Failures expected from UIA control methods (stale element, lookup miss,
+# wait timeout) — reported without a traceback.
+_EXPECTED_CONTROL_ERRORS: Tuple[Type[BaseException], ...] = (
+    (
+        pywinauto.findbestmatch.MatchError,
+        pywinauto.timings.TimeoutError,
+        COMError,
+    )
+    if pywinauto is not None
+    else ()
+)
 
 
 def _ensure_pywinauto_timings() -> None:
-    """Lazy-initialize pywinauto timings from ActionConfig."""
-    global _pywinauto_timings_initialized
-    if _pywinauto_timings_initialized:
-        return
-    _pywinauto_timings_initialized = True
+    """Lazy-initialize pywinauto timings from ActionConfig.
+
+    Runs once: the module-level name is rebound to a no-op on first call,
+    so every later receiver construction is a bare call with no checks.
+    """
+    global _ensure_pywinauto_timings
+    _ensure_pywinauto_timings = _pywinauto_timings_ready
 
     if platform.system() != "Windows" or not pywinauto:
         return
@@ -52,20 +82,162 @@ def _ensure_pywinauto_timings() -> None:
         pywinauto.timings.Timings.after_click_wait = cfg.after_click_wait
 
     pyautogui.FAILSAFE = cfg.pyautogui_failsafe
+    pyautogui.PAUSE = cfg.pyautogui_pause
+
+    if cfg.disable_double_click_guard:
+        # pywinauto.mouse spins until GetDoubleClickTime() has elapsed since
+        # the last input, regardless of Timings.after_clickinput_wait.
+        # Swap in a view of win32gui (for pywinauto.mouse only) reporting 0.
+        import pywinauto.mouse
+
+        pywinauto.mouse.win32gui = _NoDoubleClickTime(pywinauto.mouse.win32gui)
+
+
+def _pywinauto_timings_ready() -> None:
+    """Stand-in for _ensure_pywinauto_timings once timings are applied."""
+
+
+class _NoDoubleClickTime:
+    """Proxy for the win32gui module that reports a zero double-click time."""
+
+    def __init__(self, module: Any) -> None:
+        self._module = module
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._module, name)
+
+    @staticmethod
+    def GetDoubleClickTime() -> int:
+        return 0
+
+
+# Sentinel for "no clipboard text saved" and the delay before restoring it
+_CLIPBOARD_UNSET = object()
+_PASTE_SETTLE = 0.05
+
+# WaitCommand "idle": CPU percent below which the application counts as
+# idle, and the sampling window per reading
+_IDLE_CPU_PERCENT = 5.0
+_IDLE_SAMPLE_INTERVAL = 0.05
+
+# Wheel units per notch (WHEEL_DELTA)
+_WHEEL_DELTA = 120
+
+
+def _raw_scroll(
+    dx: int, dy: int, x: Optional[int] = None, y: Optional[int] = None
+) -> None:
+    """Send wheel notches straight to ``mouse_event``, bypassing pyautogui.
+
+    Positive *dy* scrolls up, positive *dx* scrolls right.  If *x*/*y* are
+    given the cursor is moved there first.  Unlike pyautogui's scroll
+    wrappers there is no trailing PAUSE sleep.
+    """
+    if x is not None and y is not None:
+        win32api.SetCursorPos((x, y))
+    if dy:
+        win32api.mouse_event(win32con.MOUSEEVENTF_WHEEL, 0, 0, dy * _WHEEL_DELTA, 0)
+    if dx:
+        win32api.mouse_event(win32con.MOUSEEVENTF_HWHEEL, 0, 0, dx * _WHEEL_DELTA, 0)
+
+
+def _clipboard_holds_only_text() -> bool:
+    """Whether the (open) clipboard is empty or holds nothing but plain text.
+
+    Only CF_UNICODETEXT is saved and restored around a paste, so anything
+    else (images, files, rich text) would be lost.
+    """
+    text_formats = (
+        win32con.CF_UNICODETEXT, win32con.CF_TEXT, win32con.CF_OEMTEXT,
+        win32con.CF_LOCALE,
+    )
+    fmt = win32clipboard.EnumClipboardFormats(0)
+    while fmt:
+        if fmt not in text_formats:
+            return False
+        fmt = win32clipboard.EnumClipboardFormats(fmt)
+    return True
+
+
+def _wait_until(
+    predicate: Callable[[], bool],
+    timeout: float,
+    max_interval: float = 0.25,
+    initial_interval: float = 0.01,
+) -> bool:
+    """Poll *predicate* with exponential back-off until true or *timeout*.
+
+    Starts at *initial_interval* and doubles up to *max_interval*, so a
+    control that becomes ready is noticed within a few milliseconds.
+    Returns the final predicate result.
+    """
+    sleep = time.sleep
+    monotonic = time.monotonic
+    deadline = monotonic() + timeout
+    interval = min(initial_interval, max_interval)
+    while not predicate():
+        now = monotonic()
+        if now >= deadline:
+            return False
+        sleep(min(interval, deadline - now))
+        interval = min(interval * 2, max_interval)
+    return True
+
+
+def _as_int(value: Any, default: int = 0) -> int:
+    """Coerce a numeric command parameter to ``int``.
+
+    Ints are returned unchanged and floats truncated directly; anything
+    else (typically a string such as ``"12.5"``) goes through ``float``.
+    """
+    kind = type(value)
+    if kind is int:
+        return value
+    if kind is float:
+        return int(value)
+    return int(float(value if value is not None else default))
 
 
 class ControlReceiver(ReceiverBasic):
     """The control receiver — wraps a UIAWrapper control for command execution."""
 
+    # Names are validated unique by ReceiverBasic.register; NoActionCommand
+    # deliberately owns the empty name (an action with no function).
     _command_registry: Dict[str, Type[CommandBasic]] = {}
 
+    # In-flight asynchronous mouse_move; shared because receivers are
+    # recreated for every command.
+    _mouse_thread: Optional[threading.Thread] = None
+    # Exception raised by that move, re-raised by sync_mouse()
+    _mouse_error: Optional[BaseException] = None
+    # Control last given keyboard focus by _set_control_focus(); shared for
+    # the same reason.
+    _focused_control: Optional[UIAWrapper] = None
+    # Window handle last brought to the foreground by _ensure_app_focused();
+    # shared so consecutive commands on one window skip set_focus().
+    _focused_hwnd: Optional[int] = None
+
     def __init__(
         self, control: Optional[UIAWrapper], application: Optional[UIAWrapper]
     ) -> None:
         _ensure_pywinauto_timings()
 
+        # Snapshot the config values used per command
+        cfg = get_action_config()
+        self._click_api = cfg.click_api
+        self._input_text_api = cfg.input_text_api
+        self._inter_key_pause = cfg.input_text_inter_key_pause
+        self._input_text_enter = cfg.input_text_enter
+        self._paste_threshold = cfg.paste_threshold
+
         self.control = control
         self.application = application
+        # Snapshot of application.rectangle(); see _get_app_rect()
+        self._app_rect_cache: Optional[RECT] = None
+        # (left, top, width, height) of _app_rect_cache
+        self._app_geometry_cache: Optional[Tuple[int, int, int, int]] = None
+        # Clipboard text to restore after a paste; see set_edit_text()
+        self._clipboard_saved: Any = _CLIPBOARD_UNSET
 
         # Only focus the application window (foreground activation).
         # Control-level set_focus() is deferred to _focus_control() and
@@ -75,7 +247,7 @@ class ControlReceiver(ReceiverBasic):
         # destroy contextual UI (e.g. ribbon tabs in WebView2 apps)
         # by shifting focus away from the currently active element.
         if application:
-            self.application.set_focus()
+            self._ensure_app_focused()
 
     def _focus_control(self) -> None:
         """Acquire keyboard focus on the target control.
@@ -86,32 +258,97 @@ class ControlReceiver(ReceiverBasic):
         pre-focusing can destroy contextual UI in WebView2 apps.
         """
         if self.control:
-            self.control.set_focus()
+            self._set_control_focus()
             self.wait_enabled()
 
+    def _set_control_focus(self) -> None:
+        """Call set_focus() on the control unless it still has keyboard focus.
+
+        set_focus() also activates the top-level window and waits for it;
+        repeated keyboard commands on the same control skip that round-trip.
+        """
+        control = self.control
+        if ControlReceiver._focused_control is control:
+            try:
+                if control.has_keyboard_focus():
+                    return
+            except _EXPECTED_CONTROL_ERRORS:
+                pass
+        ControlReceiver._focused_control = None
+        control.set_focus()
+        ControlReceiver._focused_control = control
+
+    def _ensure_app_focused(self) -> None:
+        """Bring the application to the foreground unless it already is.
+
+        Skips the set_focus() round-trip (and pywinauto's foreground wait)
+        when an earlier command focused this window and it is still
+        foreground.
+        """
+        hwnd = getattr(self.application, "handle", None)
+        if hwnd and win32gui is not None and ControlReceiver._focused_hwnd == hwnd:
+            try:
+                if win32gui.GetForegroundWindow() == hwnd:
+                    return
+            except Exception:
+                pass
+        ControlReceiver._focused_hwnd = None
+        self.application.set_focus()
+        ControlReceiver._focused_hwnd = hwnd
+
+    def _get_app_rect(self, refresh: bool = False) -> RECT:
+        """Return the application rectangle, querying UIA at most once.
+
+        The rectangle is a cross-process UIA call; commands that transform
+        several points reuse one snapshot per receiver (i.e. per command).
+        """
+        if refresh or self._app_rect_cache is None:
+            self._app_rect_cache = self.application.rectangle()
+            self._app_geometry_cache = None
+        return self._app_rect_cache
+
+    def _get_app_geometry(self) -> Tuple[int, int, int, int]:
+        """Return ``(left, top, width, height)`` of the application rectangle.
+
+        Derived once from the cached rectangle so coordinate transforms do
+        not call ``width()``/``height()`` per point.
+        """
+        geometry = self._app_geometry_cache
+        if geometry is None:
+            rect = self._get_app_rect()
+            geometry = self._app_geometry_cache = (
+                rect.left, rect.top, rect.width(), rect.height()
+            )
+        return geometry
+
+    def invalidate(self) -> None:
+        """Drop the cached application rectangle (window moved/refocused)."""
+        self._app_rect_cache = None
+        self._app_geometry_cache = None
+
     @property
     def type_name(self):
         return "UIControl"
 
     def atomic_execution(self, method_name: str, params: Dict[str, Any]) -> str:
-        import traceback
-
-        try:
-            method = getattr(self.control, method_name)
-            result = method(**params)
-        except AttributeError:
+        method = getattr(self.control, method_name, None)
+        if method is None:
             message = f"{self.control} doesn't have a method named {method_name}"
             logger.warning(message)
-            result = message
-        except Exception:
-            full_traceback = traceback.format_exc()
-            message = f"An error occurred: {full_traceback}"
-            logger.warning(message)
-            result = message
-        return result
+            return message
+
+        try:
+            return method(**params)
+        except _EXPECTED_CONTROL_ERRORS as e:
+            logger.warning("%s failed: %s", method_name, e)
+            return f"An error occurred: {e}"
+        except Exception as e:
+            logger.exception("%s raised an unexpected error", method_name)
+            return f"An error occurred: {e!r}"
 
     def click_input(self, params: Dict[str, Union[str, bool]]) -> str:
-        api_name = get_action_config().click_api
+        self.sync_mouse()
+        api_name = self._click_api
 
         if api_name == "click":
             self.atomic_execution("click", params)
@@ -120,12 +357,13 @@ class ControlReceiver(ReceiverBasic):
         return f"Click action has been executed, with parameters: {params}"
 
     def click_on_coordinates(self, params: Dict[str, str]) -> str:
-        x = int(float(params.get("x", 0)))
-        y = int(float(params.get("y", 0)))
+        self.sync_mouse()
+        x = _as_int(params.get("x"))
+        y = _as_int(params.get("y"))
         button = params.get("button", "left")
         double = params.get("double", False)
 
-        self.application.set_focus()
+        self._ensure_app_focused()
         pyautogui.click(x, y, button=button, clicks=2 if double else 1)
 
         return (
@@ -134,19 +372,20 @@ class ControlReceiver(ReceiverBasic):
         )
 
     def drag_on_coordinates(self, params: Dict[str, str]) -> str:
+        self.sync_mouse()
         start = (
-            int(float(params.get("start_x", 0))),
-            int(float(params.get("start_y", 0))),
+            _as_int(params.get("start_x")),
+            _as_int(params.get("start_y")),
         )
         end = (
-            int(float(params.get("end_x", 0))),
-            int(float(params.get("end_y", 0))),
+            _as_int(params.get("end_x")),
+            _as_int(params.get("end_y")),
         )
         duration = float(params.get("duration", 1))
         button = params.get("button", "left")
         key_hold = params.get("key_hold", None)
 
-        self.application.set_focus()
+        self._ensure_app_focused()
 
         if key_hold:
             pyautogui.keyDown(key_hold)
@@ -162,35 +401,81 @@ class ControlReceiver(ReceiverBasic):
             f"with a duration of {duration} and a button '{button}' held down."
         )
 
+    def drag_path(
+        self,
+        points: List[Tuple[int, int]],
+        button: str = "left",
+        duration: float = 1.0,
+        key_hold: Optional[str] = None,
+    ) -> str:
+        """Drag through all *points* with a single button press/release.
+
+        Focuses the application once and spreads *duration* evenly over
+        the segments, instead of one focus + press/release per segment.
+        """
+        self.sync_mouse()
+        self._ensure_app_focused()
+
+        if key_hold:
+            pyautogui.keyDown(key_hold)
+
+        segment_duration = duration / max(len(points) - 1, 1)
+        pyautogui.moveTo(points[0][0], points[0][1])
+        pyautogui.mouseDown(button=button)
+        try:
+            for x, y in points[1:]:
+                pyautogui.moveTo(x, y, duration=segment_duration)
+        finally:
+            pyautogui.mouseUp(button=button)
+            if key_hold:
+                pyautogui.keyUp(key_hold)
+
+        return (
+            f"The drag action has been executed along {len(points)} points "
+            f"from {points[0]} to {points[-1]}, with a duration of {duration} "
+            f"and a button '{button}' held down."
+        )
+
     def summary(self, params: Dict[str, str]) -> str:
         return params.get("text")
 
     def set_edit_text(self, params: Dict[str, str]) -> str:
+        self.sync_mouse()
         self._focus_control()
-        cfg = get_action_config()
         text = params.get("text", "")
-        inter_key_pause = cfg.input_text_inter_key_pause
+        inter_key_pause = self._inter_key_pause
 
-        if params.get("clear_current_text", False):
-            self.control.type_keys("^a", pause=inter_key_pause)
-            self.control.type_keys("{DELETE}", pause=inter_key_pause)
+        clear_prefix = "^a{DELETE}" if params.get("clear_current_text", False) else ""
 
-        if cfg.input_text_api == "set_text":
+        if self._input_text_api == "set_text":
+            if clear_prefix:
+                self.control.type_keys(clear_prefix, pause=inter_key_pause)
             method_name = "set_edit_text"
             args = {"text": text}
+        elif self._should_paste(text) and self._set_clipboard_text(text):
+            # Long literal text: clear, then paste it in one keystroke
+            method_name = "type_keys"
+            args = {"keys": clear_prefix + "^v", "pause": inter_key_pause}
         else:
+            # Clear and type in one keystroke stream
             method_name = "type_keys"
-            text = TextTransformer.transform_text(text, "all")
+            text = clear_prefix + TextTransformer.transform_text(text, "all")
             args = {"keys": text, "pause": inter_key_pause, "with_spaces": True}
 
         try:
-            result = self.atomic_execution(method_name, args)
+            if self._clipboard_saved is not _CLIPBOARD_UNSET:
+                try:
+                    result = self.atomic_execution(method_name, args)
+                finally:
+                    self._restore_clipboard()
+            else:
+                result = self.atomic_execution(method_name, args)
             if (
                 method_name == "set_text"
                 and args["text"] not in self.control.window_text()
             ):
                 raise Exception(f"Failed to use set_text: {args['text']}")
-            if cfg.input_text_enter and method_name in ["type_keys", "set_text"]:
+            if self._input_text_enter and method_name in ["type_keys", "set_text"]:
                 self.atomic_execution("type_keys", params={"keys": "{ENTER}"})
             return result
         except Exception as e:
@@ -211,42 +496,111 @@ class ControlReceiver(ReceiverBasic):
             else:
                 return f"An error occurred: {e}"
 
+    def _should_paste(self, text: str) -> bool:
+        """Whether *text* is long and literal enough to paste instead of type.
+
+        Text with newlines, tabs or any ``{`` is always typed: those need
+        real key events, and ``{ENTER}``, ``{TAB}`` or ``{VK_*}`` tokens are
+        key names for type_keys, not literal text.
+        """
+        threshold = self._paste_threshold
+        return (
+            threshold > 0
+            and len(text) >= threshold
+            and win32clipboard is not None
+            and "\n" not in text
+            and "\t" not in text
+            and "{" not in text
+        )
+
+    def _set_clipboard_text(self, text: str) -> bool:
+        """Put *text* on the clipboard, remembering the previous text.
+
+        Returns False, leaving the clipboard as it was, if the clipboard
+        could not be used (e.g. another process holds it open) or holds
+        formats other than plain text; the caller then types the text
+        instead.
+        """
+        try:
+            win32clipboard.OpenClipboard()
+            try:
+                if not _clipboard_holds_only_text():
+                    logger.debug("Clipboard holds non-text data, typing instead")
+                    return False
+                try:
+                    saved = win32clipboard.GetClipboardData(win32con.CF_UNICODETEXT)
+                except TypeError:
+                    # Clipboard is empty or holds no text
+                    saved = None
+                win32clipboard.EmptyClipboard()
+                self._clipboard_saved = saved
+                win32clipboard.SetClipboardData(win32con.CF_UNICODETEXT, text)
+            finally:
+                win32clipboard.CloseClipboard()
+        except Exception as e:
+            logger.warning("Clipboard unavailable, typing text instead: %s", e)
+            if self._clipboard_saved is not _CLIPBOARD_UNSET:
+                self._restore_clipboard(settle=False)
+            return False
+        return True
+
+    def _restore_clipboard(self, settle: bool = True) -> None:
+        """Put back the clipboard text saved by _set_clipboard_text().
+
+        Failures are logged, not raised: the paste itself already ran.
+        """
+        saved, self._clipboard_saved = self._clipboard_saved, _CLIPBOARD_UNSET
+        if settle:
+            # Give the target a moment to read the clipboard for the paste
+            time.sleep(_PASTE_SETTLE)
+        try:
+            win32clipboard.OpenClipboard()
+            try:
+                win32clipboard.EmptyClipboard()
+                if saved is not None:
+                    win32clipboard.SetClipboardData(win32con.CF_UNICODETEXT, saved)
+            finally:
+                win32clipboard.CloseClipboard()
+        except Exception as e:
+            logger.warning("Failed to restore the clipboard: %s", e)
+
     def keyboard_input(self, params: Dict[str, str]) -> str:
+        self.sync_mouse()
         control_focus = params.get("control_focus", True)
         keys = params.get("keys", "")
 
         if control_focus and self.control is not None:
-            self.control.set_focus()
+            self._set_control_focus()
             self.atomic_execution("type_keys", {"keys": keys})
         else:
             self.application.type_keys(keys=keys)
         return keys
 
     def key_press(self, params: Dict[str, str]) -> str:
+        self.sync_mouse()
         keys = params.get("keys", [])
-        for key in keys:
-            pyautogui.keyDown(key.lower())
-        for key in keys:
-            pyautogui.keyUp(key.lower())
+        # All key-downs, then key-ups in reverse, with one trailing PAUSE
+        pyautogui.hotkey(*[key.lower() for key in keys], interval=0)
         return f"Key press action has been executed: {keys}"
 
     def texts(self) -> str:
         return self.control.texts()
 
     def wheel_mouse_input(self, params: Dict[str, str]):
+        self.sync_mouse()
         horizontal = params.pop("horizontal", False)
         if horizontal:
             # pywinauto does not support horizontal scrolling;
-            # fall back to pyautogui.hscroll() at the control centre.
+            # fall back to a raw horizontal wheel event at the control centre.
             dist = int(params.get("wheel_dist", 0))
             target = self.control if self.control is not None else self.application
             if target is not None:
                 rect = target.rectangle()
                 cx = (rect.left + rect.right) // 2
                 cy = (rect.top + rect.bottom) // 2
-                pyautogui.hscroll(dist, x=cx, y=cy)
+                _raw_scroll(dist, 0, x=cx, y=cy)
             else:
-                pyautogui.hscroll(dist)
+                _raw_scroll(dist, 0)
             return "The horizontal wheel mouse input action has been executed."
         if self.control is not None:
             self.atomic_execution("wheel_mouse_input", params)
@@ -258,23 +612,56 @@ class ControlReceiver(ReceiverBasic):
             return "The wheel mouse input action has been executed on the application window."
 
     def scroll(self, params: Dict[str, str]) -> str:
-        x = int(params.get("x", 0))
-        y = int(params.get("y", 0))
+        self.sync_mouse()
+        # x/y are fractions of the application rectangle
+        x = float(params.get("x", 0))
+        y = float(params.get("y", 0))
         new_x, new_y = self.transform_point(x, y)
 
-        scroll_x = int(params.get("scroll_x", 0))
-        scroll_y = int(params.get("scroll_y", 0))
+        scroll_x = _as_int(params.get("scroll_x"))
+        scroll_y = _as_int(params.get("scroll_y"))
 
-        pyautogui.vscroll(scroll_y, x=new_x, y=new_y)
-        pyautogui.hscroll(scroll_x, x=new_x, y=new_y)
+        _raw_scroll(scroll_x, scroll_y, x=new_x, y=new_y)
 
     def mouse_move(self, params: Dict[str, str]) -> str:
-        x = int(params.get("x", 0))
-        y = int(params.get("y", 0))
+        # x/y are fractions of the application rectangle
+        x = float(params.get("x", 0))
+        y = float(params.get("y", 0))
         new_x, new_y = self.transform_point(x, y)
-        pyautogui.moveTo(new_x, new_y, duration=0.1)
+        self.sync_mouse()
+        thread = threading.Thread(
+            target=ControlReceiver._move_mouse,
+            args=(new_x, new_y),
+            daemon=True,
+        )
+        ControlReceiver._mouse_thread = thread
+        thread.start()
+
+    @staticmethod
+    def _move_mouse(x: int, y: int) -> None:
+        """mouse_move's thread body; keeps any error for sync_mouse()."""
+        try:
+            pyautogui.moveTo(x, y, duration=0.1)
+        except BaseException as e:
+            ControlReceiver._mouse_error = e
+
+    @classmethod
+    def sync_mouse(cls) -> None:
+        """Wait for a pending asynchronous mouse_move to reach its target.
+
+        Re-raises the exception the move failed with, if any.
+        """
+        thread = ControlReceiver._mouse_thread
+        if thread is not None:
+            thread.join()
+            ControlReceiver._mouse_thread = None
+        error = ControlReceiver._mouse_error
+        if error is not None:
+            ControlReceiver._mouse_error = None
+            raise error
 
     def type(self, params: Dict[str, str]) -> str:
+        self.sync_mouse()
         text = params.get("text", "")
         pyautogui.write(text, interval=0.1)
 
@@ -290,43 +677,51 @@ class ControlReceiver(ReceiverBasic):
         ]
         return control_reannotate
 
-    def wait_enabled(self, timeout: float = 10, retry_interval: float = 0.5) -> None:
-        while not self.control.is_enabled():
-            time.sleep(retry_interval)
-            timeout -= retry_interval
-            if timeout <= 0:
-                warnings.warn(f"Timeout: {self.control} is not enabled.")
-                break
-
-    def wait_visible(self, timeout: float = 10, retry_interval: float = 0.5) -> None:
-        while not self.control.is_visible():
-            time.sleep(retry_interval)
-            timeout -= retry_interval
-            if timeout <= 0:
-                warnings.warn(f"Timeout: {self.control} is not visible.")
-                break
-
-    def transform_point(self, fraction_x: float, fraction_y: float) -> Tuple[int, int]:
-        application_rect: RECT = self.application.rectangle()
-        application_x = application_rect.left
-        application_y = application_rect.top
-        application_width = application_rect.width()
-        application_height = application_rect.height()
-
-        x = application_x + int(application_width * fraction_x)
-        y = application_y + int(application_height * fraction_y)
-        return x, y
+    def wait_enabled(self, timeout: float = 10, retry_interval: float = 0.25) -> None:
+        if not _wait_until(self.control.is_enabled, timeout, retry_interval):
+            warnings.warn(f"Timeout: {self.control} is not enabled.")
 
-    def transform_absolute_point_to_fractional(
-        self, x: int, y: int
+    def wait_visible(self, timeout: float = 10, retry_interval: float = 0.25) -> None:
+        if not _wait_until(self.control.is_visible, timeout, retry_interval):
+            warnings.warn(f"Timeout: {self.control} is not visible.")
+
+    def transform_point(
+        self, fraction_x: float, fraction_y: float, rect: Optional[RECT] = None
     ) -> Tuple[int, int]:
-        application_rect: RECT = self.application.rectangle()
-        application_width = application_rect.width()
-        application_height = application_rect.height()
+        if rect is None:
+            left, top, width, height = self._get_app_geometry()
+        else:
+            left, top, width, height = rect.left, rect.top, rect.width(), rect.height()
+        return left + int(width * fraction_x), top + int(height * fraction_y)
+
+    def transform_absolute_point_to_fractional(
+        self, x: int, y: int, rect: Optional[RECT] = None
+    ) -> Tuple[float, float]:
+        if rect is None:
+            _, _, width, height = self._get_app_geometry()
+        else:
+            width, height = rect.width(), rect.height()
+        return x / width, y / height
+
+    def unscale_ratio(self, scaler: Optional[List[int]]) -> float:
+        """Return the factor mapping screenshot coordinates to raw pixels.
 
-        fraction_x = x / application_width
-        fraction_y = y / application_height
-        return fraction_x, fraction_y
+        *scaler* is the ``[width, height]`` of the scaled screenshot; without
+        it (or without an application window) the factor is 1.
+        """
+        if not scaler or self.application is None:
+            return 1.0
+        _, _, raw_width, raw_height = self._get_app_geometry()
+        return min(scaler[0] / raw_width, scaler[1] / raw_height)
+
+    def unscale_point(
+        self, x: int, y: int, scaler: Optional[List[int]]
+    ) -> Tuple[int, int]:
+        """Map a point on a *scaler*-sized screenshot back to raw pixels."""
+        if not scaler or self.application is None:
+            return x, y
+        ratio = self.unscale_ratio(scaler)
+        return int(x / ratio), int(y / ratio)
 
     def transform_scaled_point_to_raw(
         self,
@@ -506,17 +901,10 @@ class NoActionCommand(ControlCommand):
 @ControlReceiver.register
 class ClickCommand(ControlCommand):
     def execute(self) -> str:
-        x = int(self.params.get("x", 0))
-        y = int(self.params.get("y", 0))
-
-        if self.params.get("scaler", None) and self.receiver.application:
-            scaled_width = self.params["scaler"][0]
-            scaled_height = self.params["scaler"][1]
-            raw_width = self.receiver.application.rectangle().width()
-            raw_height = self.receiver.application.rectangle().height()
-            x, y = self.receiver.transform_scaled_point_to_raw(
-                x, y, scaled_width, scaled_height, raw_width, raw_height
-            )
+        x = _as_int(self.params.get("x"))
+        y = _as_int(self.params.get("y"))
+
+        x, y = self.receiver.unscale_point(x, y, self.params.get("scaler"))
 
         button = self.params.get("button", "left")
         button = "middle" if button == "wheel" else button
@@ -531,17 +919,10 @@ class ClickCommand(ControlCommand):
 @ControlReceiver.register
 class DoubleClickCommand(ControlCommand):
     def execute(self) -> str:
-        x = int(self.params.get("x", 0))
-        y = int(self.params.get("y", 0))
-
-        if self.params.get("scaler", None) and self.receiver.application:
-            scaled_width = self.params["scaler"][0]
-            scaled_height = self.params["scaler"][1]
-            raw_width = self.receiver.application.rectangle().width()
-            raw_height = self.receiver.application.rectangle().height()
-            x, y = self.receiver.transform_scaled_point_to_raw(
-                x, y, scaled_width, scaled_height, raw_width, raw_height
-            )
+        x = _as_int(self.params.get("x"))
+        y = _as_int(self.params.get("y"))
+
+        x, y = self.receiver.unscale_point(x, y, self.params.get("scaler"))
 
         button = self.params.get("button", "left")
         button = "middle" if button == "wheel" else button
@@ -557,29 +938,22 @@ class DoubleClickCommand(ControlCommand):
 class DragCommand(ControlCommand):
     def execute(self) -> str:
         path = self.params.get("path", [])
-        for i in range(len(path) - 1):
-            start_x, start_y = path[i].get("x", 0), path[i].get("y", 0)
-            end_x, end_y = path[i + 1].get("x", 0), path[i + 1].get("y", 0)
-
-            if self.params.get("scaler", None) and self.receiver.application:
-                scaled_width = self.params["scaler"][0]
-                scaled_height = self.params["scaler"][1]
-                raw_width = self.receiver.application.rectangle().width()
-                raw_height = self.receiver.application.rectangle().height()
-                start_x, start_y = self.receiver.transform_scaled_point_to_raw(
-                    start_x, start_y, scaled_width, scaled_height, raw_width, raw_height
-                )
-                end_x, end_y = self.receiver.transform_scaled_point_to_raw(
-                    end_x, end_y, scaled_width, scaled_height, raw_width, raw_height
-                )
+        ratio = self.receiver.unscale_ratio(self.params.get("scaler"))
+        points = [
+            (
+                int(float(point.get("x", 0)) / ratio),
+                int(float(point.get("y", 0)) / ratio),
+            )
+            for point in path
+        ]
 
-            params = {
-                "start_x": start_x,
-                "start_y": start_y,
-                "end_x": end_x,
-                "end_y": end_y,
-            }
-            self.receiver.drag_on_coordinates(params)
+        if len(points) < 2:
+            return
+        # One second per segment unless an explicit total duration is given
+        duration = float(self.params.get("duration", len(points) - 1))
+        button = self.params.get("button", "left")
+        key_hold = self.params.get("key_hold", None)
+        return self.receiver.drag_path(points, button, duration, key_hold)
 
     @classmethod
     def name(cls) -> str:
@@ -599,17 +973,10 @@ class KeyPressCommand(ControlCommand):
 @ControlReceiver.register
 class MouseMoveCommand(ControlCommand):
     def execute(self) -> str:
-        x = int(self.params.get("x", 0))
-        y = int(self.params.get("y", 0))
-
-        if self.params.get("scaler", None) and self.receiver.application:
-            scaled_width = self.params["scaler"][0]
-            scaled_height = self.params["scaler"][1]
-            raw_width = self.receiver.application.rectangle().width()
-            raw_height = self.receiver.application.rectangle().height()
-            x, y = self.receiver.transform_scaled_point_to_raw(
-                x, y, scaled_width, scaled_height, raw_width, raw_height
-            )
+        x = _as_int(self.params.get("x"))
+        y = _as_int(self.params.get("y"))
+
+        x, y = self.receiver.unscale_point(x, y, self.params.get("scaler"))
 
         new_x, new_y = self.receiver.transform_absolute_point_to_fractional(x, y)
         params = {"x": new_x, "y": new_y}
@@ -623,21 +990,14 @@ class MouseMoveCommand(ControlCommand):
 @ControlReceiver.register
 class ScrollCommand(ControlCommand):
     def execute(self) -> str:
-        x = int(self.params.get("x", 0))
-        y = int(self.params.get("y", 0))
-
-        if self.params.get("scaler", None) and self.receiver.application:
-            scaled_width = self.params["scaler"][0]
-            scaled_height = self.params["scaler"][1]
-            raw_width = self.receiver.application.rectangle().width()
-            raw_height = self.receiver.application.rectangle().height()
-            x, y = self.receiver.transform_scaled_point_to_raw(
-                x, y, scaled_width, scaled_height, raw_width, raw_height
-            )
+        x = _as_int(self.params.get("x"))
+        y = _as_int(self.params.get("y"))
+
+        x, y = self.receiver.unscale_point(x, y, self.params.get("scaler"))
 
         new_x, new_y = self.receiver.transform_absolute_point_to_fractional(x, y)
-        scroll_x = int(self.params.get("scroll_x", 0))
-        scroll_y = int(self.params.get("scroll_y", 0))
+        scroll_x = _as_int(self.params.get("scroll_x"))
+        scroll_y = _as_int(self.params.get("scroll_y"))
         params = {"x": new_x, "y": new_y, "scroll_x": scroll_x, "scroll_y": scroll_y}
         return self.receiver.scroll(params)
 
@@ -658,8 +1018,61 @@ class TypeCommand(ControlCommand):
 
 @ControlReceiver.register
 class WaitCommand(ControlCommand):
+    """Wait for the UI to settle, returning as soon as it has.
+
+    ``for`` selects the condition: ``"idle"`` (default) until the
+    application's CPU usage is low for two consecutive samples,
+    ``"visible"``/``"enabled"`` until the control is, and ``"sleep"`` for a
+    fixed delay.  No condition waits longer than ``timeout`` (default 3 s).
+    """
+
     def execute(self) -> str:
-        time.sleep(3)
+        timeout = float(self.params.get("timeout", 3.0))
+        predicate = self.params.get("for", "idle")
+        receiver = self.receiver
+
+        if predicate == "visible" and receiver.control is not None:
+            receiver.wait_visible(timeout=timeout)
+        elif predicate == "enabled" and receiver.control is not None:
+            receiver.wait_enabled(timeout=timeout)
+        elif predicate == "sleep":
+            time.sleep(timeout)
+        else:
+            idle = self._wait_idle(timeout)
+            if idle is False:
+                return f"Timed out after {timeout:g}s waiting for idle."
+            if idle is None:
+                return f"Waited {timeout:g}s (application idle state unavailable)."
+        return f"Waited for {predicate}."
+
+    def _wait_idle(self, timeout: float) -> Optional[bool]:
+        """Wait until the application is idle.
+
+        Returns True once it is (or its process has exited), False on
+        timeout, and None if the process could not be found, after
+        sleeping for *timeout* as a plain ``sleep`` would.
+        """
+        target = self.receiver.control or self.receiver.application
+        try:
+            # Cross-process UIA call: fails once the window has closed
+            process = psutil.Process(target.process_id()) if target else None
+        except (psutil.Error, *_EXPECTED_CONTROL_ERRORS):
+            process = None
+        if process is None:
+            time.sleep(timeout)
+            return None
+        deadline = time.monotonic() + timeout
+        quiet = 0
+        try:
+            while quiet < 2:
+                if time.monotonic() >= deadline:
+                    return False
+                busy = process.cpu_percent(interval=_IDLE_SAMPLE_INTERVAL)
+                quiet = quiet + 1 if busy < _IDLE_CPU_PERCENT else 0
+        except psutil.Error:
+            # The process went away; nothing left to wait for
+            pass
+        return True
 
     @classmethod
     def name(cls) -> str:
@@ -671,13 +1084,34 @@ class WaitCommand(ControlCommand):
 # ---------------------------------------------------------------------------
 
 
+# Single-character escapes applied by the "all" tag, in one translate pass
+_ALL_TRANSLATE = str.maketrans(
+    {
+        "\n": "{ENTER}",
+        "\t": "{TAB}",
+        "+": "{+}",
+        "^": "{^}",
+        "%": "{%}",
+        "(": "{(}",
+        ")": "{)}",
+    }
+)
+_VK_TABLE = {"{VK_CONTROL}": "^", "{VK_SHIFT}": "+", "{VK_MENU}": "%"}
+_VK_RE = re.compile(r"\{VK_(?:CONTROL|SHIFT|MENU)\}")
+
+
 class TextTransformer:
     """Escapes special pywinauto key sequences in text."""
 
     @staticmethod
     def transform_text(text: str, transform_tag: str) -> str:
         if transform_tag == "all":
-            transform_tag = "+\n\t^%{VK_CONTROL}{VK_SHIFT}{VK_MENU}()"
+            # Escape first, then expand {VK_*} — the expanded modifiers
+            # must stay unescaped, matching the sequential replace chain.
+            text = text.translate(_ALL_TRANSLATE)
+            if "{VK_" in text:
+                text = _VK_RE.sub(lambda m: _VK_TABLE[m.group(0)], text)
+            return text
 
         if "\n" in transform_tag:
             text = TextTransformer.transform_enter(text)
@@ -8,30 +8,127 @@ Copied from ufo/automator/ui_control/inspector.py with zero UFO dependencies.
 
 from __future__ import annotations
 
+import ctypes
 import functools
+import os
 import platform
+import sys
+import threading
 import time
 from abc import ABC, abstractmethod
-from typing import Callable, Dict, List, Optional, cast, TYPE_CHECKING, Any
+from concurrent.futures import ThreadPoolExecutor
+from typing import (
+    Callable, Dict, List, Optional, Tuple, cast, TYPE_CHECKING, Any,
+)
 
 import psutil
 
 if TYPE_CHECKING or platform.system() == "Windows":
+    import comtypes
     import comtypes.gen.UIAutomationClient as UIAutomationClient_dll
     import pywinauto
     import pywinauto.uia_defines
-    import uiautomation as auto
+    import win32gui
     from pywinauto import Desktop
     from pywinauto.controls.uiawrapper import UIAWrapper
     from pywinauto.uia_element_info import UIAElementInfo
 else:
+    comtypes = None
     UIAutomationClient_dll = None
     pywinauto = None
-    auto = None
+    win32gui = None
     Desktop = None
     UIAWrapper = Any
     UIAElementInfo = Any
 
+if TYPE_CHECKING:
+    # uiautomation is slow to import and only matters for controls that
+    # already are uiautomation objects; see get_check_state().
+    import uiautomation as auto
+
+
+# Input-method helper windows that are visible and titled but not apps
+_IGNORED_WINDOW_CLASSES = frozenset({"IME", "MSCTFIME UI"})
+
+
+# get_control_info_batch fans out to threads from this many controls on
+_BATCH_PARALLEL_MIN = 4
+_BATCH_MAX_WORKERS = 8
+
+
+def _com_is_mta() -> bool:
+    """Whether pywinauto settled on the multithreaded COM apartment.
+
+    Only then may UIA element pointers be used from worker threads.
+    """
+    return comtypes is not None and getattr(sys, "coinit_flags", None) == 0
+
+
+def _init_worker_com() -> None:
+    comtypes.CoInitializeEx(comtypes.COINIT_MULTITHREADED)
+
+
+def _make_rect(left: int, top: int, right: int, bottom: int):
+    """Build a pywinauto RECT without running its Python-level ``__init__``.
+
+    The ctypes initializer fills the four fields positionally, skipping
+    RECT.__init__'s isinstance check and per-field int conversions.  The
+    result is still a real RECT (width(), mid_point(), ctypes-compatible),
+    which a namedtuple would not be.
+    """
+    RECT = pywinauto.win32structures.RECT
+    rect = RECT.__new__(RECT)
+    ctypes.Structure.__init__(rect, left, top, right, bottom)
+    return rect
+
+
+_PROCESS_QUERY_LIMITED_INFORMATION = 0x1000
+_MAX_IMAGE_PATH = 32768
+
+
+@functools.lru_cache(maxsize=1)
+def _kernel32():
+    """kernel32 with the prototypes used by _exe_name_by_pid()."""
+    from ctypes import wintypes
+
+    kernel32 = ctypes.WinDLL("kernel32", use_last_error=True)
+    kernel32.OpenProcess.argtypes = (wintypes.DWORD, wintypes.BOOL, wintypes.DWORD)
+    kernel32.OpenProcess.restype = wintypes.HANDLE
+    kernel32.QueryFullProcessImageNameW.argtypes = (
+        wintypes.HANDLE,
+        wintypes.DWORD,
+        wintypes.LPWSTR,
+        ctypes.POINTER(wintypes.DWORD),
+    )
+    kernel32.QueryFullProcessImageNameW.restype = wintypes.BOOL
+    kernel32.CloseHandle.argtypes = (wintypes.HANDLE,)
+    kernel32.CloseHandle.restype = wintypes.BOOL
+    return kernel32
+
+
+def _exe_name_by_pid(pid: int) -> Optional[str]:
+    """Executable name of *pid* via QueryFullProcessImageNameW.
+
+    Much lighter than psutil.Process(pid).name(); returns ``None`` when the
+    lookup fails (or off Windows) so the caller can fall back to psutil.
+    """
+    if platform.system() != "Windows":
+        return None
+    kernel32 = _kernel32()
+    handle = kernel32.OpenProcess(_PROCESS_QUERY_LIMITED_INFORMATION, False, pid)
+    if not handle:
+        return None
+    try:
+        size = ctypes.c_ulong(_MAX_IMAGE_PATH)
+        buffer = ctypes.create_unicode_buffer(_MAX_IMAGE_PATH)
+        if not kernel32.QueryFullProcessImageNameW(
+            handle, 0, buffer, ctypes.byref(size)
+        ):
+            return None
+        return os.path.basename(buffer.value)
+    finally:
+        kernel32.CloseHandle(handle)
+
 
 class BackendFactory:
     """A factory class to create backend strategies."""
@@ -68,8 +165,15 @@ class BackendStrategy(ABC):
 
 
 class UIAElementInfoFix(UIAElementInfo):
+    # No __slots__: pywinauto's ElementInfo base classes keep a per-instance
+    # __dict__, so slots here would not shrink instances; the bulk path in
+    # find_control_elements_in_descendants fills that __dict__ in one update.
     _cached_rect = None
     _time_delay_marker = False
+    # Time the _get_current_* COM reads and lengthen the next sleep() after
+    # a slow one.  Off by default: the timing costs more than it saves on
+    # responsive applications.
+    _time_delay_marker_enabled = False
 
     def __init__(self, element, is_ref=False, source: Optional[str] = None):
         super().__init__(element, is_ref)
@@ -84,39 +188,45 @@ class UIAElementInfoFix(UIAElementInfo):
         UIAElementInfoFix._time_delay_marker = False
 
     @staticmethod
-    def _time_wrap(func):
-        def dec(self, *args, **kvargs):
-            before = time.time()
-            result = func(self, *args, **kvargs)
-            UIAElementInfoFix._time_delay_marker = (time.time() - before) > 0.005
-            return result
-        return dec
-
-    @_time_wrap
+    def _timed(getter: Callable[[], Any]) -> Any:
+        """Call *getter*, flagging the next sleep() if it took over 5 ms."""
+        before = time.perf_counter()
+        result = getter()
+        UIAElementInfoFix._time_delay_marker = (
+            time.perf_counter() - before
+        ) > 0.005
+        return result
+
     def _get_current_name(self):
+        if UIAElementInfoFix._time_delay_marker_enabled:
+            return self._timed(super()._get_current_name)
         return super()._get_current_name()
 
-    @_time_wrap
     def _get_current_rich_text(self):
+        if UIAElementInfoFix._time_delay_marker_enabled:
+            return self._timed(super()._get_current_rich_text)
         return super()._get_current_rich_text()
 
-    @_time_wrap
     def _get_current_class_name(self):
+        if UIAElementInfoFix._time_delay_marker_enabled:
+            return self._timed(super()._get_current_class_name)
         return super()._get_current_class_name()
 
-    @_time_wrap
     def _get_current_control_type(self):
+        if UIAElementInfoFix._time_delay_marker_enabled:
+            return self._timed(super()._get_current_control_type)
         return super()._get_current_control_type()
 
-    @_time_wrap
     def _get_current_rectangle(self):
+        if UIAElementInfoFix._time_delay_marker_enabled:
+            return self._timed(self._read_rectangle)
+        return self._read_rectangle()
+
+    def _read_rectangle(self):
         bound_rect = self._element.CurrentBoundingRectangle
-        rect = pywinauto.win32structures.RECT()
-        rect.left = bound_rect.left
-        rect.top = bound_rect.top
-        rect.right = bound_rect.right
-        rect.bottom = bound_rect.bottom
-        return rect
+        return _make_rect(
+            bound_rect.left, bound_rect.top, bound_rect.right, bound_rect.bottom
+        )
 
     def _get_cached_rectangle(self):
         if self._cached_rect is None:
@@ -136,20 +246,27 @@ class UIABackendStrategy(BackendStrategy):
     """The backend strategy for UIA."""
 
     def get_desktop_windows(self, remove_empty: bool) -> List[UIAWrapper]:
-        desktop_windows = Desktop(backend="win32").windows()
-        desktop_windows = [app for app in desktop_windows if app.is_visible()]
+        # Filter on raw HWNDs so only the surviving windows get wrapped,
+        # rather than building a win32 wrapper and then a UIA one per window.
+        handles: List[int] = []
+
+        def collect(hwnd: int, _) -> bool:
+            if win32gui.IsWindowVisible(hwnd):
+                handles.append(hwnd)
+            return True
+
+        win32gui.EnumWindows(collect, None)
 
         if remove_empty:
-            desktop_windows = [
-                app
-                for app in desktop_windows
-                if app.window_text() != ""
-                and app.element_info.class_name not in ["IME", "MSCTFIME UI"]
+            handles = [
+                hwnd
+                for hwnd in handles
+                if win32gui.GetWindowText(hwnd) != ""
+                and win32gui.GetClassName(hwnd) not in _IGNORED_WINDOW_CLASSES
             ]
 
         uia_desktop_windows: List[UIAWrapper] = [
-            UIAWrapper(UIAElementInfo(handle_or_elem=window.handle))
-            for window in desktop_windows
+            UIAWrapper(UIAElementInfo(handle_or_elem=hwnd)) for hwnd in handles
         ]
         return uia_desktop_windows
 
@@ -169,9 +286,7 @@ class UIABackendStrategy(BackendStrategy):
             class_name_list = []
         if title_list is None:
             title_list = []
-        try:
-            window.is_enabled()
-        except Exception:
+        if window is None:
             return []
 
         assert (
@@ -189,57 +304,58 @@ class UIABackendStrategy(BackendStrategy):
         )
         cache_request = UIABackendStrategy._get_cache_request()
 
-        com_elem_array = window_elem_com_ref.FindAllBuildCache(
-            scope=iuia_dll.TreeScope_Descendants,
-            condition=condition,
-            cacheRequest=cache_request,
+        # depth=1 lets UIA stop at the direct children instead of walking the
+        # whole subtree; UIA has no other depth limit, so deeper values
+        # (and the default 0) search all descendants.
+        scope = (
+            iuia_dll.TreeScope_Children if depth == 1 else iuia_dll.TreeScope_Descendants
         )
-
-        elem_info_list = [
-            (
-                elem,
-                elem.CachedControlType,
-                elem.CachedName,
-                elem.CachedBoundingRectangle,
-            )
-            for elem in (
-                com_elem_array.GetElement(n)
-                for n in range(min(com_elem_array.Length, 500))
+        try:
+            com_elem_array = window_elem_com_ref.FindAllBuildCache(
+                scope=scope,
+                condition=condition,
+                cacheRequest=cache_request,
             )
-        ]
+        except comtypes.COMError:
+            # The window went away (stale element)
+            return []
+
+        name_map = UIABackendStrategy._get_uia_control_name_map()
+        get_element = com_elem_array.GetElement
 
         control_elements: List[UIAWrapper] = []
 
-        for elem, elem_type, elem_name, elem_rect in elem_info_list:
+        for n in range(min(com_elem_array.Length, 500)):
+            elem = get_element(n)
+            elem_name = elem.CachedName
+            elem_rect = elem.CachedBoundingRectangle
+
             element_info = UIAElementInfoFix(elem, True, source="uia")
-            elem_type_name = UIABackendStrategy._get_uia_control_name_map().get(
-                elem_type, ""
+            # Seed every cached property in one go from the FindAllBuildCache
+            # results so the wrapper never goes back to COM for them.
+            element_info.__dict__.update(
+                _cached_handle=0,
+                _cached_visible=True,
+                _cached_rect=_make_rect(
+                    elem_rect.left, elem_rect.top, elem_rect.right, elem_rect.bottom
+                ),
+                _cached_name=elem_name,
+                _cached_control_type=name_map.get(elem.CachedControlType, ""),
+                _cached_rich_text=elem_name,
             )
 
-            element_info._cached_handle = 0
-            element_info._cached_visible = True
-
-            rect = pywinauto.win32structures.RECT()
-            rect.left = elem_rect.left
-            rect.top = elem_rect.top
-            rect.right = elem_rect.right
-            rect.bottom = elem_rect.bottom
-            element_info._cached_rect = rect
-            element_info._cached_name = elem_name
-            element_info._cached_control_type = elem_type_name
-            element_info._cached_rich_text = elem_name
-
-            uia_interface = UIAWrapper(element_info)
-            control_elements.append(uia_interface)
+            control_elements.append(UIAWrapper(element_info))
 
         return control_elements
 
     @staticmethod
+    @functools.lru_cache(maxsize=1)
     def _get_uia_control_id_map():
         iuia = pywinauto.uia_defines.IUIA()
         return iuia.known_control_types
 
     @staticmethod
+    @functools.lru_cache(maxsize=1)
     def _get_uia_control_name_map():
         iuia = pywinauto.uia_defines.IUIA()
         return iuia.known_control_type_ids
@@ -260,9 +376,32 @@ class UIABackendStrategy(BackendStrategy):
         is_visible: bool = True,
         is_enabled: bool = True,
     ):
-        if control_type_list is None:
-            control_type_list = []
+        # Resolve names to control-type ids up front so equivalent filters
+        # (names vs. ids, duplicates) share one cached condition.
+        id_map = UIABackendStrategy._get_uia_control_id_map()
+        type_ids = tuple(
+            dict.fromkeys(
+                control_type if isinstance(control_type, int) else id_map[control_type]
+                for control_type in control_type_list or ()
+            )
+        )
+        return UIABackendStrategy._build_control_filter_condition(
+            type_ids, bool(is_visible), bool(is_enabled)
+        )
+
+    @staticmethod
+    @functools.lru_cache(maxsize=64)
+    def _build_control_filter_condition(
+        type_ids: Tuple[int, ...],
+        is_visible: bool,
+        is_enabled: bool,
+    ):
+        """Build the COM condition tree; cached, as conditions are immutable."""
         iuia_com, iuia_dll = UIABackendStrategy._get_uia_defs()
+        type_conditions = [
+            iuia_com.CreatePropertyCondition(iuia_dll.UIA_ControlTypePropertyId, type_id)
+            for type_id in type_ids
+        ]
         condition = iuia_com.CreateAndConditionFromArray(
             [
                 iuia_com.CreatePropertyCondition(
@@ -274,21 +413,7 @@ class UIABackendStrategy(BackendStrategy):
                 iuia_com.CreatePropertyCondition(
                     iuia_dll.UIA_IsControlElementPropertyId, True
                 ),
-                iuia_com.CreateOrConditionFromArray(
-                    [
-                        iuia_com.CreatePropertyCondition(
-                            iuia_dll.UIA_ControlTypePropertyId,
-                            (
-                                control_type
-                                if control_type is int
-                                else UIABackendStrategy._get_uia_control_id_map()[
-                                    control_type
-                                ]
-                            ),
-                        )
-                        for control_type in control_type_list
-                    ]
-                ),
+                iuia_com.CreateOrConditionFromArray(type_conditions),
             ]
         )
         return condition
@@ -313,7 +438,7 @@ class Win32BackendStrategy(BackendStrategy):
                 app
                 for app in desktop_windows
                 if app.window_text() != ""
-                and app.element_info.class_name not in ["IME", "MSCTFIME UI"]
+                and app.element_info.class_name not in _IGNORED_WINDOW_CLASSES
             ]
         return desktop_windows
 
@@ -376,18 +501,25 @@ class Win32BackendStrategy(BackendStrategy):
 class ControlInspectorFacade:
     """Singleton facade for control inspection."""
 
-    _instances = {}
+    _instances: Dict[str, "ControlInspectorFacade"] = {}
+    _lock = threading.Lock()
 
     def __new__(cls, backend: str = "uia") -> "ControlInspectorFacade":
-        if backend not in cls._instances:
-            instance = super().__new__(cls)
-            instance.backend = backend
-            instance.backend_strategy = BackendFactory.create_backend(backend)
-            cls._instances[backend] = instance
-        return cls._instances[backend]
+        instance = cls._instances.get(backend)
+        if instance is None:
+            with cls._lock:
+                # Re-check: another thread may have created it meanwhile
+                instance = cls._instances.get(backend)
+                if instance is None:
+                    instance = super().__new__(cls)
+                    instance.backend = backend
+                    instance.backend_strategy = BackendFactory.create_backend(backend)
+                    cls._instances[backend] = instance
+        return instance
 
     def __init__(self, backend: str = "uia") -> None:
-        self.backend = backend
+        # Fully initialized in __new__; nothing to redo for a cached instance
+        pass
 
     def get_desktop_windows(self, remove_empty: bool = True) -> List[UIAWrapper]:
         return self.backend_strategy.get_desktop_windows(remove_empty)
@@ -415,21 +547,43 @@ class ControlInspectorFacade:
 
     def get_desktop_app_dict(self, remove_empty: bool = True) -> Dict[str, UIAWrapper]:
         desktop_windows = self.get_desktop_windows(remove_empty)
-        desktop_windows_with_gui = []
-        for window in desktop_windows:
-            try:
-                window.is_normal()
-                desktop_windows_with_gui.append(window)
-            except Exception:
-                pass
+        has_window_ui = (
+            self._uia_has_window_ui if self.backend == "uia" else self._has_window_ui
+        )
+        desktop_windows_with_gui = [
+            window for window in desktop_windows if has_window_ui(window)
+        ]
+
+        return {
+            str(i): window for i, window in enumerate(desktop_windows_with_gui, 1)
+        }
+
+    @staticmethod
+    def _has_window_ui(window: UIAWrapper) -> bool:
+        """Whether *window* is alive and reports a window show state."""
+        try:
+            window.is_normal()
+            return True
+        except Exception:
+            return False
+
+    @staticmethod
+    def _uia_has_window_ui(window: UIAWrapper) -> bool:
+        """UIA variant of _has_window_ui reading one property.
 
-        desktop_windows_dict = dict(
-            zip(
-                [str(i + 1) for i in range(len(desktop_windows_with_gui))],
-                desktop_windows_with_gui,
+        is_normal() queries the Window pattern and then its visual state
+        (three COM calls); IsWindowPatternAvailable answers the same
+        question in one.
+        """
+        try:
+            _, iuia_dll = UIABackendStrategy._get_uia_defs()
+            return bool(
+                window.element_info.element.GetCurrentPropertyValue(
+                    iuia_dll.UIA_IsWindowPatternAvailablePropertyId
+                )
             )
-        )
-        return desktop_windows_dict
+        except Exception:
+            return False
 
     def get_desktop_app_info(
         self,
@@ -446,24 +600,37 @@ class ControlInspectorFacade:
     ) -> List[Dict[str, str]]:
         if field_list is None:
             field_list = []
-        control_info_list = []
-        for window in window_list:
-            control_info_list.append(self.get_control_info(window, field_list))
-        return control_info_list
+        if len(window_list) < _BATCH_PARALLEL_MIN or not _com_is_mta():
+            return [self.get_control_info(window, field_list) for window in window_list]
+
+        # Property reads are COM calls that release the GIL; overlap them.
+        with ThreadPoolExecutor(
+            max_workers=min(_BATCH_MAX_WORKERS, len(window_list)),
+            initializer=_init_worker_com,
+        ) as pool:
+            return list(
+                pool.map(
+                    functools.partial(self.get_control_info, field_list=field_list),
+                    window_list,
+                )
+            )
 
     def get_control_info_list_of_dict(
         self, window_dict: Dict[str, UIAWrapper], field_list: Optional[List[str]] = None
     ) -> List[Dict[str, str]]:
-        control_info_list = []
-        for key in window_dict.keys():
-            window = window_dict[key]
-            control_info = self.get_control_info(window, field_list)
+        control_info_list = self.get_control_info_batch(
+            list(window_dict.values()), field_list
+        )
+        for key, control_info in zip(window_dict, control_info_list):
             control_info["label"] = key
-            control_info_list.append(control_info)
         return control_info_list
 
     @staticmethod
     def get_check_state(control_item: auto.Control) -> bool | None:
+        # A uiautomation Control can only exist if its module was imported.
+        auto = sys.modules.get("uiautomation")
+        if auto is None:
+            return None
         is_checked = None
         try:
             assert isinstance(control_item, auto.Control)
@@ -493,33 +660,35 @@ class ControlInspectorFacade:
             field_list = []
         control_info: Dict[str, str] = {}
 
+        # Each property is read only if requested; most are COM round-trips.
         def assign(prop_name: str, prop_value_func: Callable[[], str]) -> None:
-            if len(field_list) > 0 and prop_name not in field_list:
+            if field_list and prop_name not in field_list:
                 return
             control_info[prop_name] = prop_value_func()
 
         try:
-            assign("control_type", lambda: window.element_info.control_type)
-            assign("control_id", lambda: window.element_info.control_id)
-            assign("control_class", lambda: window.element_info.class_name)
-            assign("control_name", lambda: window.element_info.name)
-            rectangle = window.element_info.rectangle
-            assign(
-                "control_rect",
-                lambda: (
+            element_info = window.element_info
+            assign("control_type", lambda: element_info.control_type)
+            assign("control_id", lambda: element_info.control_id)
+            assign("control_class", lambda: element_info.class_name)
+            assign("control_name", lambda: element_info.name)
+
+            def rect_tuple():
+                rectangle = element_info.rectangle
+                return (
                     rectangle.left,
                     rectangle.top,
                     rectangle.right,
                     rectangle.bottom,
-                ),
-            )
-            assign("control_text", lambda: window.element_info.name)
+                )
+
+            assign("control_rect", rect_tuple)
+            assign("control_text", lambda: element_info.name)
             assign("control_title", lambda: window.window_text())
             assign("selected", lambda: ControlInspectorFacade.get_check_state(window))
 
             try:
-                source = window.element_info.source
-                assign("source", lambda: source)
+                assign("source", lambda: element_info.source)
             except Exception:
                 assign("source", lambda: "")
 
@@ -532,6 +701,9 @@ class ControlInspectorFacade:
         if window is None:
             return ""
         process_id = window.process_id()
+        name = _exe_name_by_pid(process_id)
+        if name is not None:
+            return name
         try:
             process = psutil.Process(process_id)
             return process.name()
@@ -8,12 +8,15 @@ from __future__ import annotations
 import json
 from dataclasses import dataclass, field
 from enum import Enum
-from typing import Any, Dict, List, Optional
-
-from pydantic import BaseModel, Field
+from typing import AbstractSet, Any, Dict, List, Optional
 
 from winactions.targets import TargetInfo
 
+try:
+    import orjson
+except ImportError:  # optional speed-up, see the "fast" extra
+    orjson = None
+
 
 # --- Inlined from aip/messages.py ---
 
@@ -27,12 +30,40 @@ class ResultStatus(str, Enum):
     NONE = "none"
 
 
-class Result(BaseModel):
+@dataclass(slots=True)
+class Result:
     """Represents the result of a command execution."""
 
-    status: ResultStatus = Field(..., description="Execution status")
-    error: Optional[str] = Field(default=None, description="Error message if failed")
-    result: Any = Field(default=None, description="Result payload")
+    # Execution status
+    status: ResultStatus
+    # Error message if failed
+    error: Optional[str] = None
+    # Result payload
+    result: Any = None
+
+    def __post_init__(self) -> None:
+        if not isinstance(self.status, ResultStatus):
+            self.status = ResultStatus(self.status)
+
+    def as_dict(self) -> Dict[str, Any]:
+        return {
+            "status": self.status,
+            "error": self.error,
+            "result": _copy_container(self.result),
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> Result:
+        return cls(**data)
+
+
+def _copy_container(value: Any) -> Any:
+    """Shallow copy of a dict or list payload, so dumps don't alias it."""
+    if isinstance(value, dict):
+        return dict(value)
+    if isinstance(value, list):
+        return list(value)
+    return value
 
 
 # --- Adapted from ufo/agents/processors/schemas/actions.py ---
@@ -64,21 +95,66 @@ class ActionExecutionLog:
     return_value: Any = None
 
 
-class ActionCommandInfo(BaseModel):
+@dataclass(slots=True)
+class ActionCommandInfo:
     """Action information — what function to call, on which target, with what arguments."""
 
     function: str = ""
     status: str = ""
-    arguments: Dict[str, Any] = Field(default_factory=dict)
+    arguments: Dict[str, Any] = field(default_factory=dict)
     target: Optional[TargetInfo] = None
-    result: Result = Field(default_factory=lambda: Result(status="none"))
-    action_string: str = ""
+    result: Result = field(default_factory=lambda: Result(status=ResultStatus.NONE))
     action_representation: str = ""
 
-    def model_post_init(self, __context: Any) -> None:
-        self.action_string = ActionCommandInfo.to_string(
-            self.function, self.arguments
-        )
+    @property
+    def action_string(self) -> str:
+        """The function call string, built on read so it tracks ``arguments``."""
+        return ActionCommandInfo.to_string(self.function, self.arguments)
+
+    def as_dict(self, include: Optional[AbstractSet[str]] = None) -> Dict[str, Any]:
+        """Plain-dict form; *include* limits the output to those keys.
+
+        Only the included fields are converted, so a narrow *include* skips
+        dumping the target and result entirely.
+        """
+        if include is not None:
+            return {
+                name: self._dump_field(name)
+                for name in _ACTION_FIELDS
+                if name in include
+            }
+        target = self.target
+        return {
+            "function": self.function,
+            "status": self.status,
+            "arguments": dict(self.arguments),
+            "target": target.model_dump() if target is not None else None,
+            "result": self.result.as_dict(),
+            "action_string": self.action_string,
+            "action_representation": self.action_representation,
+        }
+
+    def _dump_field(self, name: str) -> Any:
+        value = getattr(self, name)
+        if name == "target":
+            return value.model_dump() if value is not None else None
+        if name == "result":
+            return value.as_dict()
+        if name == "arguments":
+            return dict(value)
+        return value
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> ActionCommandInfo:
+        data = dict(data)
+        data.pop("action_string", None)  # derived
+        target = data.get("target")
+        if isinstance(target, dict):
+            data["target"] = TargetInfo(**target)
+        result = data.get("result")
+        if isinstance(result, dict):
+            data["result"] = Result.from_dict(result)
+        return cls(**data)
 
     @staticmethod
     def to_string(command_name: str, params: Dict[str, Any]) -> str:
@@ -107,6 +183,18 @@ class ActionCommandInfo(BaseModel):
         return "\n".join(components)
 
 
+# Key order of ActionCommandInfo.as_dict()
+_ACTION_FIELDS = (
+    "function",
+    "status",
+    "arguments",
+    "target",
+    "result",
+    "action_string",
+    "action_representation",
+)
+
+
 class ListActionCommandInfo:
     """A sequence of one-step actions."""
 
@@ -125,14 +213,13 @@ class ListActionCommandInfo:
 
     @property
     def status(self) -> str:
-        if not self.actions:
-            status = "FINISH"
-        else:
-            status = "CONTINUE"
-            for action in self.actions:
-                if action.result.status == ResultStatus.SUCCESS:
-                    status = action.status
-        return status
+        """Status of the last successful action, or CONTINUE if none succeeded."""
+        if not self._actions:
+            return "FINISH"
+        for action in reversed(self._actions):
+            if action.result.status == ResultStatus.SUCCESS:
+                return action.status
+        return "CONTINUE"
 
     def add_action(self, action: ActionCommandInfo) -> None:
         self._actions.append(action)
@@ -143,13 +230,12 @@ class ListActionCommandInfo:
         keep_keys: Optional[List[str]] = None,
         previous_actions: Optional[List[ActionCommandInfo | Dict[str, Any]]] = None,
     ) -> List[Dict[str, Any]]:
+        keep_set = frozenset(keep_keys) if keep_keys else None
         action_list = []
         for action in self.actions:
             if success_only and action.result.status != ResultStatus.SUCCESS:
                 continue
-            action_dict = action.model_dump()
-            if keep_keys:
-                action_dict = {k: v for k, v in action_dict.items() if k in keep_keys}
+            action_dict = action.as_dict(include=keep_set)
             if previous_actions:
                 repeat_time = self.count_repeat_times(action, previous_actions)
                 action_dict["repeat_time"] = repeat_time
@@ -161,9 +247,19 @@ class ListActionCommandInfo:
         success_only: bool = False,
         previous_actions: Optional[List[ActionCommandInfo]] = None,
     ) -> str:
-        return json.dumps(
-            self.to_list_of_dicts(success_only, previous_actions), ensure_ascii=False
+        action_list = self.to_list_of_dicts(
+            success_only, previous_actions=previous_actions
         )
+        if orjson is not None:
+            try:
+                return orjson.dumps(
+                    action_list, option=orjson.OPT_NON_STR_KEYS
+                ).decode("utf-8")
+            except TypeError:
+                pass  # e.g. integers beyond 64 bits — let json handle it
+        # Compact separators: the same bytes as orjson, so prompts and logs
+        # don't depend on whether the "fast" extra is installed
+        return json.dumps(action_list, ensure_ascii=False, separators=(",", ":"))
 
     def to_representation(self, success_only: bool = False) -> List[str]:
         representations = []
@@ -191,41 +287,39 @@ class ListActionCommandInfo:
                 print(action.to_representation())
                 print("---")
 
+    @staticmethod
+    def _action_key(action: ActionCommandInfo | Dict[str, Any]) -> tuple:
+        """The (function, arguments) pair that identifies a repeated action."""
+        if isinstance(action, ActionCommandInfo):
+            return action.function, action.arguments
+        return action.get("function"), action.get("arguments")
+
     @staticmethod
     def is_same_action(
         action1: ActionCommandInfo | Dict[str, Any],
         action2: ActionCommandInfo | Dict[str, Any],
     ) -> bool:
-        if isinstance(action1, ActionCommandInfo):
-            action_dict_1 = action1.model_dump()
-        else:
-            action_dict_1 = action1
-
-        if isinstance(action2, ActionCommandInfo):
-            action_dict_2 = action2.model_dump()
-        else:
-            action_dict_2 = action2
-
-        return action_dict_1.get("function") == action_dict_2.get(
-            "function"
-        ) and action_dict_1.get("arguments") == action_dict_2.get("arguments")
+        return ListActionCommandInfo._action_key(
+            action1
+        ) == ListActionCommandInfo._action_key(action2)
 
     def count_repeat_times(
         self,
         target_action: ActionCommandInfo,
         previous_actions: List[ActionCommandInfo | Dict[str, Any]],
     ) -> int:
+        action_key = self._action_key
+        target_key = action_key(target_action)
         count = 0
-        for action in previous_actions[::-1]:
-            if self.is_same_action(action, target_action):
-                count += 1
-            else:
+        for action in reversed(previous_actions):
+            if action_key(action) != target_key:
                 break
+            count += 1
         return count
 
     def get_results(self, success_only: bool = False) -> List[Dict[str, Any]]:
         return [
-            action.result.model_dump()
+            action.result.as_dict()
             for action in self.actions
             if not success_only or action.result.status == ResultStatus.SUCCESS
         ]
@@ -7,8 +7,13 @@ a list of TargetInfo objects with assigned index numbers.
 from __future__ import annotations
 
 import platform
-from typing import Any, List, Protocol, TYPE_CHECKING
+from bisect import bisect_left
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
+from operator import itemgetter
+from typing import Any, List, Protocol, Tuple, TYPE_CHECKING
 
+from winactions.control.inspector import _com_is_mta, _init_worker_com
 from winactions.targets import TargetInfo, TargetKind
 
 if TYPE_CHECKING or platform.system() == "Windows":
@@ -64,6 +69,12 @@ DEFAULT_CONTROL_TYPES = [
 ]
 
 
+# Properties detect() reads.  The UIA inspector pre-caches exactly these
+# (Name, ControlType, BoundingRectangle) in its FindAllBuildCache request,
+# so asking for nothing else keeps get_control_info free of COM calls.
+_DETECT_FIELDS = ["control_text", "control_type", "control_rect"]
+
+
 class UIAStateProvider:
     """Default perception source using pywinauto UIA backend."""
 
@@ -84,20 +95,28 @@ class UIAStateProvider:
         controls = self.inspector.find_control_elements_in_descendants(
             window, control_type_list=self.control_type_list
         )
+        if getattr(self.inspector, "backend", "uia") == "uia":
+            # Served from the find's property cache: no COM to overlap
+            get_control_info = self.inspector.get_control_info
+            infos = [get_control_info(control, _DETECT_FIELDS) for control in controls]
+        else:
+            # Live property reads; the batch call overlaps them on threads
+            infos = self.inspector.get_control_info_batch(controls, _DETECT_FIELDS)
+
+        # The inspector's values are already typed (str names, int rects),
+        # so skip pydantic validation with model_construct.
+        construct = TargetInfo.model_construct
+        control_kind = TargetKind.CONTROL
         targets = []
-        for i, control in enumerate(controls):
-            info = self.inspector.get_control_info(control)
+        for i, info in enumerate(infos, 1):
+            rect = info.get("control_rect")
             targets.append(
-                TargetInfo(
-                    kind=TargetKind.CONTROL,
-                    id=str(i + 1),  # 1-indexed
+                construct(
+                    kind=control_kind,
+                    id=str(i),  # 1-indexed
                     name=info.get("control_text", ""),
                     type=info.get("control_type", ""),
-                    rect=(
-                        list(info["control_rect"])
-                        if info.get("control_rect")
-                        else None
-                    ),
+                    rect=list(rect) if rect else None,
                 )
             )
         return targets, controls
@@ -110,6 +129,11 @@ class CompositeStateProvider:
     targets[i].  UIA targets carry UIAWrapper handles; vision-only targets
     carry None, signalling the execution layer to fall back to coordinate
     based clicking.
+
+    Under the multithreaded COM apartment the additional providers run on
+    worker threads while the primary one runs on the caller's, so their
+    model round trips overlap instead of adding up.  Results are merged in
+    provider order either way.
     """
 
     def __init__(
@@ -125,13 +149,23 @@ class CompositeStateProvider:
     def detect(
         self, window: UIAWrapper,
     ) -> tuple[List[TargetInfo], List]:
-        primary_targets, primary_controls = self.primary.detect(window)
+        if self.additional and _com_is_mta():
+            with ThreadPoolExecutor(
+                max_workers=len(self.additional),
+                initializer=_init_worker_com,
+            ) as pool:
+                futures = [pool.submit(p.detect, window) for p in self.additional]
+                primary_targets, primary_controls = self.primary.detect(window)
+                extra_results = [f.result() for f in futures]
+        else:
+            primary_targets, primary_controls = self.primary.detect(window)
+            extra_results = (p.detect(window) for p in self.additional)
+
         merged_targets = list(primary_targets)
         merged_controls = list(primary_controls)
 
-        for provider in self.additional:
-            extra_targets, extra_controls = provider.detect(window)
-            merged_targets, merged_controls = _merge_by_iou_with_controls(
+        for extra_targets, extra_controls in extra_results:
+            _merge_by_iou_with_controls(
                 merged_targets,
                 merged_controls,
                 extra_targets,
@@ -140,8 +174,9 @@ class CompositeStateProvider:
             )
 
         # Re-assign sequential IDs after merge
-        for i, t in enumerate(merged_targets):
-            t.id = str(i + 1)
+        ids = map(str, range(1, len(merged_targets) + 1))
+        for t, target_id in zip(merged_targets, ids):
+            t.id = target_id
         return merged_targets, merged_controls
 
 
@@ -151,17 +186,10 @@ def merge_by_iou(
     threshold: float,
 ) -> List[TargetInfo]:
     """IOU-based deduplication merge (from UFO's merge_target_info_list algorithm)."""
-    merged = main.copy()
-    for extra in additional:
-        is_overlapping = False
-        if extra.rect:
-            for m in main:
-                if m.rect and _iou(m.rect, extra.rect) > threshold:
-                    is_overlapping = True
-                    break
-        if not is_overlapping:
-            merged.append(extra)
-    return merged
+    overlapping = _overlap_flags(main, additional, threshold)
+    return main + [
+        extra for extra, overlaps in zip(additional, overlapping) if not overlaps
+    ]
 
 
 def _merge_by_iou_with_controls(
@@ -170,39 +198,81 @@ def _merge_by_iou_with_controls(
     extra_targets: List[TargetInfo],
     extra_controls: List,
     threshold: float,
-) -> tuple[List[TargetInfo], List]:
+) -> None:
     """IOU-based deduplication merge that preserves the parallel controls list.
 
-    Same algorithm as merge_by_iou, but maintains a controls list in lockstep
-    with the targets list so that CompositeStateProvider can return both.
+    Same algorithm as merge_by_iou, but appends the surviving extras to
+    *main_targets* and *main_controls* in place, keeping the two lists in
+    lockstep so that CompositeStateProvider can return both.
     """
-    merged_targets = list(main_targets)
-    merged_controls = list(main_controls)
+    overlapping = _overlap_flags(main_targets, extra_targets, threshold)
+    for extra_t, extra_c, overlaps in zip(extra_targets, extra_controls, overlapping):
+        if not overlaps:
+            main_targets.append(extra_t)
+            main_controls.append(extra_c)
 
-    for extra_t, extra_c in zip(extra_targets, extra_controls):
-        is_overlapping = False
-        if extra_t.rect:
-            for m in main_targets:
-                if m.rect and _iou(m.rect, extra_t.rect) > threshold:
-                    is_overlapping = True
-                    break
-        if not is_overlapping:
-            merged_targets.append(extra_t)
-            merged_controls.append(extra_c)
 
-    return merged_targets, merged_controls
+def _overlap_flags(
+    main: List[TargetInfo],
+    extras: List[TargetInfo],
+    threshold: float,
+) -> List[bool]:
+    """For each extra target, whether it overlaps any main target by IOU.
+
+    Computed for all extras at once against boxes built from *main* a
+    single time.  Extras without a rect never overlap.
+    """
+    main_boxes = sorted((_box(m.rect) for m in main if m.rect), key=itemgetter(0))
+    # Main boxes sorted by left edge: only those left of a probe's right
+    # edge can intersect it, found with one bisect instead of a full scan.
+    lefts = [b[0] for b in main_boxes]
+    flags = []
+    for extra in extras:
+        if not extra.rect:
+            flags.append(False)
+            continue
+        box = _box(extra.rect)
+        if threshold >= 0:
+            left, top, right, bottom = box[0], box[1], box[2], box[3]
+            candidates = islice(main_boxes, bisect_left(lefts, right))
+            flags.append(
+                any(
+                    m[2] > left
+                    and m[3] > top
+                    and bottom > m[1]
+                    and _box_iou(m, box) > threshold
+                    for m in candidates
+                )
+            )
+        else:
+            # IOU 0 counts as overlap: every main box must be considered
+            flags.append(any(_box_iou(m, box) > threshold for m in main_boxes))
+    return flags
+
+
+def _box(rect: List[int]) -> Tuple[int, int, int, int, int]:
+    """``(left, top, right, bottom, area)`` for a rect, area computed once."""
+    left, top, right, bottom = rect
+    return left, top, right, bottom, (right - left) * (bottom - top)
+
+
+def _box_iou(box1: Tuple[int, ...], box2: Tuple[int, ...]) -> float:
+    """IOU of two boxes from _box(), reusing their precomputed areas."""
+    l1, t1, r1, b1, area1 = box1
+    l2, t2, r2, b2, area2 = box2
+    if r1 <= l2 or r2 <= l1 or b1 <= t2 or b2 <= t1:
+        return 0.0  # separated on an axis: the common case when merging
+    # Inline comparisons rather than min()/max(): this runs per candidate
+    # pair and the builtin calls dominate the arithmetic.
+    width = (r1 if r1 < r2 else r2) - (l1 if l1 > l2 else l2)
+    height = (b1 if b1 < b2 else b2) - (t1 if t1 > t2 else t2)
+    if width <= 0 or height <= 0:
+        return 0.0  # degenerate (inverted) rects
+    intersection = width * height
+    union = area1 + area2 - intersection
+    return intersection / union if union > 0 else 0.0
 
 
 def _iou(rect1: List[int], rect2: List[int]) -> float:
     """Compute Intersection over Union for two [left, top, right, bottom] rects."""
-    left = max(rect1[0], rect2[0])
-    top = max(rect1[1], rect2[1])
-    right = min(rect1[2], rect2[2])
-    bottom = min(rect1[3], rect2[3])
-
-    intersection = max(0, right - left) * max(0, bottom - top)
-    area1 = (rect1[2] - rect1[0]) * (rect1[3] - rect1[1])
-    area2 = (rect2[2] - rect2[0]) * (rect2[3] - rect2[1])
-    union = area1 + area2 - intersection
-
-    return intersection / union if union > 0 else 0.0
+    return _box_iou(_box(rect1), _box(rect2))
@@ -7,6 +7,7 @@ actual UIAWrapper objects for command execution.
 
 from __future__ import annotations
 
+import json
 import platform
 from dataclasses import dataclass, field
 from datetime import datetime
@@ -19,6 +20,11 @@ if TYPE_CHECKING or platform.system() == "Windows":
 else:
     UIAWrapper = Any
 
+try:
+    import orjson
+except ImportError:  # optional speed-up, see the "fast" extra
+    orjson = None
+
 
 @dataclass
 class UIState:
@@ -60,17 +66,17 @@ class UIState:
         Verbose: includes rect for all targets.
         Vision-only elements always include rect.
         """
+        # Plain dict literals: same shape as model_dump(include=...) without
+        # pydantic walking its schema once per target.
+        control_map = self.control_map
         targets_out = []
         for t in self.targets:
-            ctrl = self.control_map.get(t.id)
-            if verbose or (ctrl is None and t.rect):
+            if verbose or (t.rect and control_map.get(t.id) is None):
                 targets_out.append(
-                    t.model_dump(include={"id", "name", "type", "rect"})
+                    {"id": t.id, "name": t.name, "type": t.type, "rect": t.rect}
                 )
             else:
-                targets_out.append(
-                    t.model_dump(include={"id", "name", "type"})
-                )
+                targets_out.append({"id": t.id, "name": t.name, "type": t.type})
         return {
             "window": self.window_title,
             "handle": self.window_handle,
@@ -81,6 +87,16 @@ class UIState:
             "timestamp": self.timestamp,
         }
 
+    def to_json_bytes(self, verbose: bool = False) -> bytes:
+        """UTF-8 encoded :meth:`to_json`, using orjson when it is installed."""
+        data = self.to_json(verbose=verbose)
+        if orjson is not None:
+            try:
+                return orjson.dumps(data, option=orjson.OPT_NON_STR_KEYS)
+            except TypeError:
+                pass  # e.g. integers beyond 64 bits — let json handle it
+        return json.dumps(data, ensure_ascii=False).encode("utf-8")
+
     def resolve(self, target_id: str) -> Optional[Any]:
         """Resolve an index number to the actual UIAWrapper control."""
         return self.control_map.get(target_id)
@@ -19,7 +19,8 @@ import json
 import logging
 import os
 import platform
-from typing import Any, Dict, List, Optional, TYPE_CHECKING
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Tuple, TYPE_CHECKING
 
 from winactions.targets import TargetInfo, TargetKind
 
@@ -30,6 +31,17 @@ else:
 
 logger = logging.getLogger(__name__)
 
+_JSON_DECODER = json.JSONDecoder()
+
+# Control types the inference rules reason about; everything else (buttons,
+# text, images, ...) only adds prompt tokens.
+_STRUCTURAL_TYPES = frozenset(
+    {"Header", "HeaderItem", "DataItem", "Table", "DataGrid", "Pane"}
+)
+
+# Number of layout fingerprints whose inference results are kept
+_INFERENCE_CACHE_SIZE = 64
+
 # ---------------------------------------------------------------------------
 # Inference prompt — tells the model how to reason about UIA structure
 # ---------------------------------------------------------------------------
@@ -129,6 +141,8 @@ class StructuralInferenceProvider:
         self._max_tokens = max_tokens
         self._min_confidence = min_confidence
         self._client = None  # lazy-initialized
+        # Layout fingerprint -> raw inferred elements, least recently used first
+        self._inference_cache: OrderedDict[Tuple, List[Dict[str, Any]]] = OrderedDict()
 
     @property
     def client(self):
@@ -176,8 +190,9 @@ class StructuralInferenceProvider:
         # 3. Combine UIA + inferred, assign sequential IDs
         merged_targets = list(uia_targets) + inferred
         merged_controls = list(uia_controls) + [None] * len(inferred)
-        for i, t in enumerate(merged_targets):
-            t.id = str(i + 1)
+        ids = map(str, range(1, len(merged_targets) + 1))
+        for t, target_id in zip(merged_targets, ids):
+            t.id = target_id
         return merged_targets, merged_controls
 
     # ------------------------------------------------------------------
@@ -188,11 +203,12 @@ class StructuralInferenceProvider:
         self, uia_targets: List[TargetInfo],
     ) -> List[TargetInfo]:
         """Format UIA data, call LLM, parse and filter results."""
+        uia_targets = [t for t in uia_targets if t.type in _STRUCTURAL_TYPES]
         text = self._format_uia_data(uia_targets)
         if not text.strip():
             return []
 
-        raw_elements = self._call_model(text)
+        raw_elements = self._cached_call_model(uia_targets, text)
 
         # Filter by confidence threshold
         inferred: List[TargetInfo] = []
@@ -230,26 +246,63 @@ class StructuralInferenceProvider:
 
         return inferred
 
+    def _cached_call_model(
+        self, uia_targets: List[TargetInfo], uia_text: str,
+    ) -> List[Dict[str, Any]]:
+        """Call the model unless this control layout was already analyzed.
+
+        The fingerprint is each structural control's type, name and rect:
+        the model names inferred elements after the controls (e.g. "Column
+        border between Subject and Date"), so renamed headers need a new
+        call, while a steady layout is a dict lookup.  Unparseable replies
+        are not cached, so the next refresh asks the model again.
+        """
+        fingerprint = tuple(
+            (t.type, t.name, tuple(t.rect or ())) for t in uia_targets
+        )
+        cache = self._inference_cache
+        raw_elements = cache.get(fingerprint)
+        if raw_elements is not None:
+            cache.move_to_end(fingerprint)
+            logger.debug("Structural inference cache hit")
+            return raw_elements
+
+        raw_elements = self._call_model(uia_text)
+        if raw_elements is None:
+            return []
+        cache[fingerprint] = raw_elements
+        if len(cache) > _INFERENCE_CACHE_SIZE:
+            cache.popitem(last=False)
+        return raw_elements
+
     @staticmethod
     def _format_uia_data(targets: List[TargetInfo]) -> str:
         """Format UIA targets as plain text for the LLM prompt."""
-        lines = []
-        for t in targets:
-            rect_str = f"rect={t.rect}" if t.rect else "rect=None"
-            lines.append(f'[{t.id}] [{t.type}] "{t.name}" {rect_str}')
-        return "\n".join(lines)
+        return "\n".join(
+            f'[{t.id}] [{t.type}] "{t.name}" rect={t.rect or None}' for t in targets
+        )
 
-    def _call_model(self, uia_text: str) -> List[Dict[str, Any]]:
-        """Send the UIA control list to the LLM and parse the response."""
-        prompt = _INFERENCE_PROMPT + uia_text
+    def _call_model(self, uia_text: str) -> Optional[List[Dict[str, Any]]]:
+        """Send the UIA control list to the LLM and parse the response.
 
+        Returns None when the reply could not be parsed.
+        """
         message = self.client.messages.create(
             model=self._model,
             max_tokens=self._max_tokens,
             messages=[
                 {
                     "role": "user",
-                    "content": prompt,
+                    "content": [
+                        # Static instructions first, marked cacheable so the
+                        # prefix is not re-processed on every call.
+                        {
+                            "type": "text",
+                            "text": _INFERENCE_PROMPT,
+                            "cache_control": {"type": "ephemeral"},
+                        },
+                        {"type": "text", "text": uia_text},
+                    ],
                 }
             ],
         )
@@ -263,43 +316,35 @@ class StructuralInferenceProvider:
         return self._parse_response(response_text)
 
     @staticmethod
-    def _parse_response(response_text: str) -> List[Dict[str, Any]]:
-        """Parse the model's JSON response, stripping markdown fences if present."""
+    def _parse_response(response_text: str) -> Optional[List[Dict[str, Any]]]:
+        """Parse the model's JSON response, stripping markdown fences if present.
+
+        Returns None if the reply is not a JSON array.
+        """
         text = response_text.strip()
 
         # Strip markdown code fences (```json ... ``` or ``` ... ```)
         if text.startswith("```"):
-            lines = text.split("\n")
-            lines = [line for line in lines if not line.strip().startswith("```")]
-            text = "\n".join(lines)
+            text = text[text.find("\n") + 1 :]
+            if text.endswith("```"):
+                text = text[: text.rfind("```")]
 
-        # Extract the JSON array — the model may append reasoning text after it.
-        # Find the outermost [...] bracket pair.
+        # Decode the JSON array starting at the first "[" — raw_decode stops
+        # at its closing bracket, so reasoning text appended after it is ignored.
         start = text.find("[")
-        if start != -1:
-            depth = 0
-            for i in range(start, len(text)):
-                if text[i] == "[":
-                    depth += 1
-                elif text[i] == "]":
-                    depth -= 1
-                    if depth == 0:
-                        text = text[start : i + 1]
-                        break
-
         try:
-            elements = json.loads(text)
+            elements, _ = _JSON_DECODER.raw_decode(text, max(start, 0))
             if not isinstance(elements, list):
                 logger.warning(
                     "Structural inference model returned non-list type: %s",
                     type(elements).__name__,
                 )
-                return []
+                return None
             return elements
         except json.JSONDecodeError as exc:
             logger.warning(
                 "Failed to parse structural inference response: %s", exc
             )
             logger.debug("Raw response (first 500 chars): %s", text[:500])
-            return []
+            return None
 
@@ -13,14 +13,16 @@ Design note (UFO Tier-2 strategy):
 
 from __future__ import annotations
 
-import base64
+import hashlib
 import json
 import logging
 import os
 import platform
+from collections import OrderedDict
 from io import BytesIO
 from typing import Any, Dict, List, Optional, TYPE_CHECKING
 
+from winactions._utils import b64encode_str
 from winactions.targets import TargetInfo, TargetKind
 
 if TYPE_CHECKING or platform.system() == "Windows":
@@ -94,6 +96,14 @@ DEFAULT_MAX_TOKENS = 4096
 # so we know the exact scale factor for coordinate conversion.
 _MAX_IMAGE_LONG_SIDE = 1568
 
+_JSON_DECODER = json.JSONDecoder()
+
+# Number of distinct screenshots whose detections are kept
+_DETECTION_CACHE_SIZE = 64
+
+# Upload encodings: PIL format name and API media type
+_IMAGE_FORMATS = {"png": ("PNG", "image/png"), "jpeg": ("JPEG", "image/jpeg")}
+
 class VisionStateProvider:
     """Perception source using a multimodal model API for visual element detection.
 
@@ -110,7 +120,13 @@ class VisionStateProvider:
         base_url: Optional[str] = None,
         model: str = DEFAULT_MODEL,
         max_tokens: int = DEFAULT_MAX_TOKENS,
+        image_format: str = "png",
     ):
+        if image_format not in _IMAGE_FORMATS:
+            raise ValueError(
+                f"Unsupported image_format {image_format!r}; "
+                f"expected one of {sorted(_IMAGE_FORMATS)}"
+            )
         self._api_key = api_key or os.environ.get("ANTHROPIC_API_KEY")
         if not self._api_key:
             raise ValueError(
@@ -121,7 +137,10 @@ class VisionStateProvider:
         self._base_url = base_url or os.environ.get("ANTHROPIC_BASE_URL")
         self._model = model
         self._max_tokens = max_tokens
+        self._image_format, self._media_type = _IMAGE_FORMATS[image_format]
         self._client = None  # lazy-initialized
+        # Screenshot digest -> raw image-space detections, least recently used first
+        self._detection_cache: OrderedDict[tuple, List[Dict[str, Any]]] = OrderedDict()
 
     @property
     def client(self):
@@ -155,37 +174,41 @@ class VisionStateProvider:
         agent can use ``click-at`` / ``drag-at`` directly.
         """
         try:
-            # 1. Capture window screenshot → raw base64 + scale factors
-            image_b64, scale_x, scale_y = self._capture_screenshot(window)
+            # 1. Capture window screenshot → (resized) image + scale factors
+            image, scale_x, scale_y = self._capture_screenshot(window)
 
             # 2. Window rect for coordinate conversion
             #    (screenshot coords are window-relative; TargetInfo.rect
             #     must be absolute screen coordinates)
             win_rect = window.rectangle()
 
-            # 3. Call the vision model
-            raw_elements = self._call_model(image_b64)
+            # 3. Call the vision model (unless these exact pixels were seen)
+            raw_elements = self._cached_call_model(image)
 
             # 4. Convert to TargetInfo with absolute screen coordinates
             #    Model returns coords in the (possibly resized) image space.
             #    Scale back to original screenshot resolution, then offset
             #    by the window position on screen.
+            #    (round() without ndigits already returns an int)
+            win_left, win_top = win_rect.left, win_rect.top
+            control_kind = TargetKind.CONTROL
             targets: List[TargetInfo] = []
             for elem in raw_elements:
                 rect = elem.get("rect")
                 if rect and len(rect) == 4:
+                    left, top, right, bottom = rect
                     abs_rect = [
-                        int(round(rect[0] * scale_x)) + win_rect.left,
-                        int(round(rect[1] * scale_y)) + win_rect.top,
-                        int(round(rect[2] * scale_x)) + win_rect.left,
-                        int(round(rect[3] * scale_y)) + win_rect.top,
+                        round(left * scale_x) + win_left,
+                        round(top * scale_y) + win_top,
+                        round(right * scale_x) + win_left,
+                        round(bottom * scale_y) + win_top,
                     ]
                 else:
                     abs_rect = None
 
                 targets.append(
                     TargetInfo(
-                        kind=TargetKind.CONTROL,
+                        kind=control_kind,
                         name=elem.get("name", ""),
                         type=elem.get("type", "VisionElement"),
                         rect=abs_rect,
@@ -210,8 +233,8 @@ class VisionStateProvider:
 
     def _capture_screenshot(
         self, window: UIAWrapper
-    ) -> tuple[str, float, float]:
-        """Capture the window, resize if needed, return (base64, scale_x, scale_y).
+    ) -> tuple[Any, float, float]:
+        """Capture the window, resize if needed, return (image, scale_x, scale_y).
 
         The image is resized so that its longest side does not exceed
         ``_MAX_IMAGE_LONG_SIDE``.  The scale factors map the resized
@@ -249,18 +272,70 @@ class VisionStateProvider:
             scale_x = 1.0
             scale_y = 1.0
 
+        return image, scale_x, scale_y
+
+    def _cached_call_model(self, image) -> List[Dict[str, Any]]:
+        """Call the model unless an identical screenshot was already analyzed.
+
+        Detections are cached in image space, keyed by a digest of the
+        pixels, so an unchanged window skips encoding and the API round
+        trip even if it has moved (the caller re-applies the offset).
+        Unparseable replies are not cached, so the next capture retries.
+        """
+        key = (image.mode, image.size, hashlib.blake2b(image.tobytes()).digest())
+        cache = self._detection_cache
+        raw_elements = cache.get(key)
+        if raw_elements is not None:
+            cache.move_to_end(key)
+            logger.debug("Vision detection cache hit")
+            return raw_elements
+
+        raw_elements = self._call_model(self._encode_image(image))
+        if raw_elements is None:
+            return []
+        cache[key] = raw_elements
+        if len(cache) > _DETECTION_CACHE_SIZE:
+            cache.popitem(last=False)
+        return raw_elements
+
+    def _encode_image(self, image) -> str:
+        """Base64 encoding of *image* for the API request.
+
+        PNG uses the fastest zlib level: ``optimize=True`` re-runs the
+        compressor over every pixel for a few percent smaller upload.
+        JPEG is smaller still, at the cost of ringing around thin lines.
+        """
+        from winactions.screenshot.photographer import PNG_DIRECT_MODES
+
         buffered = BytesIO()
-        if image.mode not in ("RGB", "RGBA", "L", "P"):
-            image = image.convert("RGB")
-        image.save(buffered, format="PNG", optimize=True)
-        b64 = base64.b64encode(buffered.getvalue()).decode("ascii")
-        return b64, scale_x, scale_y
-
-    def _call_model(self, image_b64: str) -> List[Dict[str, Any]]:
-        """Send the screenshot to the Anthropic API and parse the response."""
+        if self._image_format == "JPEG":
+            if image.mode != "RGB":
+                image = image.convert("RGB")
+            image.save(buffered, format="JPEG", quality=85)
+        else:
+            if image.mode not in PNG_DIRECT_MODES:
+                image = image.convert("RGB")
+            image.save(buffered, format="PNG", compress_level=1)
+        # getbuffer() exposes the bytes in place; getvalue() would copy them
+        return b64encode_str(buffered.getbuffer())
+
+    def _call_model(self, image_b64: str) -> Optional[List[Dict[str, Any]]]:
+        """Send the screenshot to the Anthropic API and parse the response.
+
+        Returns None when the reply could not be parsed.
+        """
         message = self.client.messages.create(
             model=self._model,
             max_tokens=self._max_tokens,
+            # The static instructions go first as a cacheable system block;
+            # only the screenshot changes from call to call.
+            system=[
+                {
+                    "type": "text",
+                    "text": _DETECTION_PROMPT,
+                    "cache_control": {"type": "ephemeral"},
+                }
+            ],
             messages=[
                 {
                     "role": "user",
@@ -269,18 +344,21 @@ class VisionStateProvider:
                             "type": "image",
                             "source": {
                                 "type": "base64",
-                                "media_type": "image/png",
+                                "media_type": self._media_type,
                                 "data": image_b64,
                             },
                         },
-                        {
-                            "type": "text",
-                            "text": _DETECTION_PROMPT,
-                        },
                     ],
                 }
             ],
         )
+        usage = getattr(message, "usage", None)
+        if usage is not None:
+            logger.debug(
+                "Vision prompt cache: read=%s created=%s",
+                getattr(usage, "cache_read_input_tokens", None),
+                getattr(usage, "cache_creation_input_tokens", None),
+            )
 
         # Extract text from response blocks
         response_text = ""
@@ -291,39 +369,31 @@ class VisionStateProvider:
         return self._parse_response(response_text)
 
     @staticmethod
-    def _parse_response(response_text: str) -> List[Dict[str, Any]]:
-        """Parse the model's JSON response, stripping markdown fences if present."""
+    def _parse_response(response_text: str) -> Optional[List[Dict[str, Any]]]:
+        """Parse the model's JSON response, stripping markdown fences if present.
+
+        Returns None if the reply is not a JSON array.
+        """
         text = response_text.strip()
 
         # Strip markdown code fences (```json … ``` or ``` … ```)
         if text.startswith("```"):
-            lines = text.split("\n")
-            lines = [line for line in lines if not line.strip().startswith("```")]
-            text = "\n".join(lines)
+            text = text[text.find("\n") + 1 :]
+            if text.endswith("```"):
+                text = text[: text.rfind("```")]
 
-        # Extract the JSON array — the model may append reasoning text after it.
-        # Find the outermost [...] bracket pair.
+        # Decode the JSON array starting at the first "[" — raw_decode stops
+        # at its closing bracket, so reasoning text appended after it is ignored.
         start = text.find("[")
-        if start != -1:
-            depth = 0
-            for i in range(start, len(text)):
-                if text[i] == "[":
-                    depth += 1
-                elif text[i] == "]":
-                    depth -= 1
-                    if depth == 0:
-                        text = text[start : i + 1]
-                        break
-
         try:
-            elements = json.loads(text)
+            elements, _ = _JSON_DECODER.raw_decode(text, max(start, 0))
             if not isinstance(elements, list):
                 logger.warning(
                     "Vision model returned non-list type: %s", type(elements).__name__
                 )
-                return []
+                return None
             return elements
         except json.JSONDecodeError as exc:
             logger.warning("Failed to parse vision model response: %s", exc)
             logger.debug("Raw response (first 500 chars): %s", text[:500])
-            return []
+            return None
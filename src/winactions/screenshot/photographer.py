@@ -5,11 +5,11 @@ Adapted from ufo/automator/ui_control/screenshot.py with config decoupled.
 
 from __future__ import annotations
 
-import base64
 import functools
 import logging
 import os
 import platform
+import threading
 from abc import ABC, abstractmethod
 from io import BytesIO
 from typing import Dict, List, Optional, Tuple, TYPE_CHECKING, Any
@@ -26,7 +26,7 @@ else:
 if TYPE_CHECKING:
     from winactions.targets import TargetInfo
 
-from winactions._utils import coordinate_adjusted
+from winactions._utils import b64encode_str, coordinate_adjusted
 
 logger = logging.getLogger(__name__)
 
@@ -34,6 +34,10 @@ DEFAULT_PNG_COMPRESS_LEVEL = 6
 DEFAULT_ANNOTATION_FONT_SIZE = 25
 DEFAULT_ANNOTATION_COLORS: Dict[str, str] = {}
 
+# Image modes written to PNG as-is; anything else is converted to RGB first.
+# Screen grabs are already RGB, so the conversion is the rare path.
+PNG_DIRECT_MODES = frozenset({"RGB", "RGBA", "L", "P"})
+
 
 class Photographer(ABC):
     """Abstract class for the photographer."""
@@ -48,7 +52,17 @@ class Photographer(ABC):
         scale_ratio = min(scaler[0] / raw_width, scaler[1] / raw_height)
         new_width = int(raw_width * scale_ratio)
         new_height = int(raw_height * scale_ratio)
-        resized_image = image.resize((new_width, new_height), Image.Resampling.LANCZOS)
+        if (new_width, new_height) == (raw_width, raw_height):
+            resized_image = image
+        else:
+            resized_image = image.resize(
+                (new_width, new_height), Image.Resampling.LANCZOS
+            )
+        if (new_width, new_height) == tuple(scaler):
+            # Same aspect ratio: nothing to letterbox, skip the black canvas
+            if resized_image.mode == "RGB":
+                return resized_image
+            return resized_image.convert("RGB")
         new_image = Image.new("RGB", scaler, (0, 0, 0))
         new_image.paste(resized_image, (0, 0))
         return new_image
@@ -123,14 +137,17 @@ class AnnotationDecorator(PhotographerDecorator):
         border_color: str = "#FF0000",
         button_color: str = "#FFF68F",
     ) -> Image.Image:
+        # Positional on purpose: lru_cache keys keyword and positional calls
+        # differently, so one canonical call shape keeps a single entry per
+        # (label, style).
         button_img = AnnotationDecorator._get_button_img(
             label_text,
-            botton_margin=botton_margin,
-            border_width=border_width,
-            font_size=font_size,
-            font_color=font_color,
-            border_color=border_color,
-            button_color=button_color,
+            botton_margin,
+            border_width,
+            font_size,
+            font_color,
+            border_color,
+            button_color,
         )
         image.paste(button_img, (coordinate[0], coordinate[1]))
         return image
@@ -164,11 +181,41 @@ class AnnotationDecorator(PhotographerDecorator):
         )
         return button_img
 
+    @classmethod
+    def prewarm(cls, label_count: int = 50, button_color: str = "#FFF68F") -> None:
+        """Render the first *label_count* number labels into the button cache.
+
+        Goes through draw_rectangles_controls with the same arguments as
+        capture_with_annotation_dict, so the cached entries are the ones an
+        annotated screenshot will look up.
+        """
+        scratch = Image.new("RGB", (1, 1))
+        try:
+            for i in range(1, label_count + 1):
+                cls.draw_rectangles_controls(
+                    scratch,
+                    (0, 0),
+                    str(i),
+                    font_size=DEFAULT_ANNOTATION_FONT_SIZE,
+                    button_color=button_color,
+                )
+        except OSError:
+            logger.debug("Annotation font unavailable, skipping prewarm")
+
     @staticmethod
     @functools.lru_cache(maxsize=64, typed=False)
     def _get_font(name: str, size: int):
         return ImageFont.truetype(name, size)
 
+    @staticmethod
+    @functools.lru_cache(maxsize=64, typed=False)
+    def _get_overlay_color(button_color: str) -> Tuple[int, int, int, int]:
+        """Translucent RGBA fill for a ``#RRGGBB`` button color."""
+        if button_color.startswith("#"):
+            rgb = tuple(int(button_color[i : i + 2], 16) for i in (1, 3, 5))
+            return rgb + (80,)
+        return (255, 246, 143, 80)
+
     def get_annotation_dict(self) -> Dict[str, UIAWrapper]:
         annotation_dict = {}
         for i, control in enumerate(self.sub_control_list):
@@ -182,64 +229,58 @@ class AnnotationDecorator(PhotographerDecorator):
         save_path: Optional[str] = None,
         path: Optional[str] = None,
         highlight_bbox: bool = False,
+        image: Optional[Image.Image] = None,
     ) -> Image.Image:
         window_rect = self.photographer.control.rectangle()
-        if path and os.path.exists(path):
+        if image is not None:
+            # Caller already holds the capture; annotate a copy in memory
+            # rather than grabbing the window again or decoding a file.
+            screenshot_annotated = image.copy()
+        elif path and os.path.exists(path):
             screenshot_annotated = Image.open(path)
         else:
             screenshot_annotated = self.photographer.capture()
 
         color_dict = DEFAULT_ANNOTATION_COLORS
 
+        # One rectangle() read (a cross-process UIA call) and one color
+        # lookup per control, shared by the overlay and the label passes.
+        items = []
+        for label_text, control in annotation_dict.items():
+            adjusted_rect = coordinate_adjusted(window_rect, control.rectangle())
+            button_color = (
+                color_dict.get(control.element_info.control_type, self.color_default)
+                if self.color_diff
+                else self.color_default
+            )
+            items.append((label_text, adjusted_rect, button_color))
+
         if highlight_bbox:
             overlay = Image.new("RGBA", screenshot_annotated.size, (255, 255, 255, 0))
             overlay_draw = ImageDraw.Draw(overlay)
 
-            for label_text, control in annotation_dict.items():
-                control_rect = control.rectangle()
-                adjusted_rect = coordinate_adjusted(window_rect, control_rect)
-
-                button_color = (
-                    color_dict.get(
-                        control.element_info.control_type, self.color_default
-                    )
-                    if self.color_diff
-                    else self.color_default
-                )
-
-                if button_color.startswith("#"):
-                    rgb = tuple(int(button_color[i : i + 2], 16) for i in (1, 3, 5))
-                    rgba_color = rgb + (80,)
-                else:
-                    rgba_color = (255, 246, 143, 80)
-
+            for _, adjusted_rect, button_color in items:
                 overlay_draw.rectangle(
                     adjusted_rect,
-                    fill=rgba_color,
+                    fill=self._get_overlay_color(button_color),
                     outline=(255, 160, 160, 180),
                     width=2,
                 )
 
-            screenshot_annotated = Image.alpha_composite(
-                screenshot_annotated.convert("RGBA"), overlay
-            ).convert("RGB")
+            # Blend the overlay in place, using its alpha as the paste mask.
+            # On an opaque screenshot this matches alpha_composite without
+            # the two full-image RGBA/RGB conversions around it.
+            if screenshot_annotated.mode != "RGB":
+                screenshot_annotated = screenshot_annotated.convert("RGB")
+            screenshot_annotated.paste(overlay, (0, 0), overlay)
 
-        for label_text, control in annotation_dict.items():
-            control_rect = control.rectangle()
-            adjusted_rect = coordinate_adjusted(window_rect, control_rect)
-            adjusted_coordinate = (adjusted_rect[0], adjusted_rect[1])
+        for label_text, adjusted_rect, button_color in items:
             screenshot_annotated = self.draw_rectangles_controls(
                 screenshot_annotated,
-                adjusted_coordinate,
+                (adjusted_rect[0], adjusted_rect[1]),
                 label_text,
                 font_size=DEFAULT_ANNOTATION_FONT_SIZE,
-                button_color=(
-                    color_dict.get(
-                        control.element_info.control_type, self.color_default
-                    )
-                    if self.color_diff
-                    else self.color_default
-                ),
+                button_color=button_color,
             )
 
         if save_path is not None and screenshot_annotated is not None:
@@ -248,9 +289,13 @@ class AnnotationDecorator(PhotographerDecorator):
             )
         return screenshot_annotated
 
-    def capture(self, save_path: Optional[str] = None) -> Image.Image:
+    def capture(
+        self, save_path: Optional[str] = None, image: Optional[Image.Image] = None
+    ) -> Image.Image:
         annotation_dict = self.get_annotation_dict()
-        return self.capture_with_annotation_dict(annotation_dict, save_path)
+        return self.capture_with_annotation_dict(
+            annotation_dict, save_path, image=image
+        )
 
 
 class PhotographerFactory:
@@ -270,11 +315,20 @@ class PhotographerFacade:
     _instance = None
     _empty_image_string = "data:image/png;base64,iVBORw0KGgoAAAANSUhEUgAAAAEAAAABCAYAAAAfFcSJAAAADUlEQVR42mNk+M9QDwADhgGAWjR9awAAAABJRU5ErkJggg=="
 
+    _lock = threading.Lock()
+
     def __new__(cls):
-        if cls._instance is None:
-            cls._instance = super().__new__(cls)
-            cls._instance.screenshot_factory = PhotographerFactory()
-        return cls._instance
+        instance = cls._instance
+        if instance is None:
+            with cls._lock:
+                # Re-check: another thread may have won the race
+                instance = cls._instance
+                if instance is None:
+                    instance = super().__new__(cls)
+                    instance.screenshot_factory = PhotographerFactory()
+                    # Publish only once fully initialized
+                    cls._instance = instance
+        return instance
 
     def capture_app_window_screenshot(
         self, control: UIAWrapper, save_path=None, scalar: List[int] = None
@@ -298,12 +352,18 @@ class PhotographerFacade:
         color_diff: bool = True,
         color_default: str = "#FFF68F",
         save_path: Optional[str] = None,
+        image: Optional[Image.Image] = None,
     ) -> Image.Image:
+        """Annotate *sub_control_list* on a window screenshot.
+
+        Pass an already captured *image* of the window to annotate a copy
+        of it instead of capturing again.
+        """
         screenshot = self.screenshot_factory.create_screenshot("app_window", control)
         screenshot = AnnotationDecorator(
             screenshot, sub_control_list, annotation_type, color_diff, color_default
         )
-        return screenshot.capture(save_path)
+        return screenshot.capture(save_path, image=image)
 
     def get_annotation_dict(
         self,
@@ -321,22 +381,11 @@ class PhotographerFacade:
         if not target1.rect or not target2.rect:
             return 0.0
 
-        r1_left, r1_top, r1_right, r1_bottom = target1.rect
-        r2_left, r2_top, r2_right, r2_bottom = target2.rect
-
-        left = max(r1_left, r2_left)
-        top = max(r1_top, r2_top)
-        right = min(r1_right, r2_right)
-        bottom = min(r1_bottom, r2_bottom)
+        # Same kernel as the perception merge: exits on axis separation
+        # before any area arithmetic.
+        from winactions.perception.provider import _iou
 
-        intersection_area = max(0, right - left) * max(0, bottom - top)
-        area1 = (r1_right - r1_left) * (r1_bottom - r1_top)
-        area2 = (r2_right - r2_left) * (r2_bottom - r2_top)
-
-        union_area = area1 + area2 - intersection_area
-        if union_area == 0:
-            return 0.0
-        return intersection_area / union_area
+        return _iou(target1.rect, target2.rect)
 
     @staticmethod
     def merge_target_info_list(
@@ -344,17 +393,17 @@ class PhotographerFacade:
         additional_target_list: List["TargetInfo"],
         iou_overlap_threshold: float = 0.1,
     ) -> List["TargetInfo"]:
-        """Merge two TargetInfo lists, removing overlapping targets from additional list."""
-        merged = main_target_list.copy()
-        for additional in additional_target_list:
-            is_overlapping = False
-            for main in main_target_list:
-                if PhotographerFacade.target_info_iou(additional, main) > iou_overlap_threshold:
-                    is_overlapping = True
-                    break
-            if not is_overlapping:
-                merged.append(additional)
-        return merged
+        """Merge two TargetInfo lists, removing overlapping targets from additional list.
+
+        Delegates to the perception layer's merge, which sorts the main
+        rects by left edge so each additional target is only compared with
+        the main targets that can intersect it, instead of all of them.
+        """
+        from winactions.perception.provider import merge_by_iou
+
+        return merge_by_iou(
+            main_target_list, additional_target_list, iou_overlap_threshold
+        )
 
     @classmethod
     def encode_image(cls, image: Image.Image, mime_type: Optional[str] = None) -> str:
@@ -363,12 +412,12 @@ class PhotographerFacade:
             return cls._empty_image_string
         try:
             buffered = BytesIO()
-            if image.mode not in ["RGB", "RGBA", "L", "P"]:
+            if image.mode not in PNG_DIRECT_MODES:
                 image = image.convert("RGB")
             image.save(buffered, format="PNG", optimize=True)
             if mime_type is None:
                 mime_type = "image/png"
-            encoded_image = base64.b64encode(buffered.getvalue()).decode("ascii")
+            encoded_image = b64encode_str(buffered.getbuffer())
             return f"data:{mime_type};base64,{encoded_image}"
         except Exception as e:
             logger.error(f"Error encoding image: {e}")
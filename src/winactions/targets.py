@@ -6,9 +6,9 @@ decision, and execution layers.
 
 import logging
 from enum import Enum
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, Dict, Iterable, List, Optional, Union
 
-from pydantic import BaseModel
+from pydantic import BaseModel, TypeAdapter
 
 
 class TargetKind(str, Enum):
@@ -19,6 +19,19 @@ class TargetKind(str, Enum):
     THIRD_PARTY_AGENT = "third_party_agent"
 
 
+# Value -> member, so trusted ingest skips Enum.__call__.  TargetKind is a
+# str enum: members hash and compare like their values, so they hit too.
+_KIND_MAP: Dict[str, TargetKind] = {k.value: k for k in TargetKind}
+
+
+def _to_kind(value: Any) -> TargetKind:
+    """Coerce a kind value to TargetKind; ValueError if it is not one."""
+    try:
+        return _KIND_MAP[value]
+    except (KeyError, TypeError):  # not a known value, or unhashable
+        return TargetKind(value)
+
+
 class TargetInfo(BaseModel):
     """Information about a UI target element."""
 
@@ -29,39 +42,110 @@ class TargetInfo(BaseModel):
     rect: Optional[List[int]] = None  # [left, top, right, bottom]
 
 
+def _dump_target(target: TargetInfo) -> Dict[str, Any]:
+    """``target.model_dump()``, read straight from ``__dict__`` when possible.
+
+    TargetInfo's fields are flat and stored as-is, so copying the instance
+    dict (and the rect list) gives the same result without pydantic's
+    serializer.  Subclasses may add fields or serializers and still dump
+    the regular way.
+    """
+    if type(target) is not TargetInfo:
+        return target.model_dump()
+    data = dict(target.__dict__)
+    rect = data["rect"]
+    if rect is not None:
+        data["rect"] = list(rect)
+    return data
+
+
+def _project_target(
+    target: TargetInfo, fields: List[str], keys: frozenset
+) -> Dict[str, Any]:
+    """``_dump_target(target)`` restricted to *keys*.
+
+    *fields* is the kept subset of TargetInfo's fields in declaration
+    order; plain instances read just those from ``__dict__``.
+    """
+    if type(target) is not TargetInfo:
+        return {k: v for k, v in target.model_dump().items() if k in keys}
+    data = target.__dict__
+    row = {k: data[k] for k in fields}
+    rect = row.get("rect")
+    if rect is not None:
+        row["rect"] = list(rect)
+    return row
+
+
+def _remove_indexed(
+    index: Dict[Any, List[TargetInfo]], key: Any, target: TargetInfo
+) -> None:
+    """Drop *target* (by identity, not equality) from its bucket in *index*."""
+    bucket = index.get(key)
+    if bucket is None:
+        return
+    for i, t in enumerate(bucket):
+        if t is target:
+            del bucket[i]
+            break
+    if not bucket:
+        del index[key]
+
+
+# One compiled validator for a whole list of target dicts
+_TARGET_LIST_ADAPTER = TypeAdapter(List[TargetInfo])
+
+
 class TargetRegistry:
-    """Registry for managing target information."""
+    """Registry for managing target information.
+
+    Targets are also indexed by name and by kind, as of registration time;
+    rename a target by unregistering and registering it again.
+    """
 
     def __init__(self) -> None:
         self._targets: Dict[str, TargetInfo] = {}
+        self._by_name: Dict[str, List[TargetInfo]] = {}
+        self._by_kind: Dict[TargetKind, List[TargetInfo]] = {}
         self._counter = 0
         self.logger = logging.getLogger(self.__class__.__name__)
 
-    def register(self, target: Union[TargetInfo, List[TargetInfo]]) -> List[TargetInfo]:
-        """Register a target or a list of targets."""
-        if not isinstance(target, list):
-            target = [target]
-
+    def register(
+        self, target: Union[TargetInfo, Iterable[TargetInfo]]
+    ) -> List[TargetInfo]:
+        """Register a target or an iterable of targets (list, tuple, generator)."""
+        targets = (target,) if isinstance(target, TargetInfo) else target
+
+        # Registry state in locals for the loop; the counter is written back
+        # once at the end.
+        store = self._targets
+        by_name = self._by_name
+        by_kind = self._by_kind
+        counter = self._counter
         registered = []
-        for t in target:
-            if not t.id:
-                self._counter += 1
-                t.id = str(self._counter)
+        for t in targets:
+            target_id = t.id
+            if not target_id:
+                counter += 1
+                target_id = t.id = str(counter)
 
-            if t.id in self._targets:
+            if target_id in store:
                 self.logger.warning(
-                    f"Target with ID {t.id} is already registered, ignoring.",
+                    f"Target with ID {target_id} is already registered, ignoring.",
                 )
             else:
-                self._targets[t.id] = t
+                store[target_id] = t
+                by_name.setdefault(t.name, []).append(t)
+                by_kind.setdefault(t.kind, []).append(t)
                 registered.append(t)
 
+        self._counter = counter
         return registered
 
     def register_from_dict(self, target_dict: Dict[str, Any]) -> TargetInfo:
         """Register a target from a dictionary."""
         target = TargetInfo(
-            kind=TargetKind(target_dict["kind"]),
+            kind=_to_kind(target_dict["kind"]),
             name=target_dict["name"],
             id=target_dict.get("id"),
             type=target_dict.get("type"),
@@ -72,8 +156,35 @@ class TargetRegistry:
     def register_from_dicts(
         self, target_dicts: List[Dict[str, Any]]
     ) -> List[TargetInfo]:
-        """Register targets from a list of dictionaries."""
-        return [self.register_from_dict(d) for d in target_dicts]
+        """Register targets from a list of dictionaries.
+
+        The list is validated in a single pass by a prebuilt TypeAdapter,
+        then registered as a batch.
+        """
+        return self.register(_TARGET_LIST_ADAPTER.validate_python(target_dicts))
+
+    def register_from_dicts_fast(
+        self, target_dicts: List[Dict[str, Any]]
+    ) -> List[TargetInfo]:
+        """Register targets from trusted dictionaries, skipping validation.
+
+        For internally produced, already well-typed data (e.g. perception
+        output).  Values are stored as given; use register_from_dicts for
+        anything that crosses a process or user boundary.
+        """
+        construct = TargetInfo.model_construct
+        targets = []
+        for d in target_dicts:
+            targets.append(
+                construct(
+                    kind=_to_kind(d["kind"]),
+                    name=d["name"],
+                    id=d.get("id"),
+                    type=d.get("type"),
+                    rect=d.get("rect"),
+                )
+            )
+        return self.register(targets)
 
     def get(self, target_id: str) -> Optional[TargetInfo]:
         """Get a target by its ID."""
@@ -81,7 +192,7 @@ class TargetRegistry:
 
     def find_by_name(self, name: str) -> List[TargetInfo]:
         """Find targets by their name."""
-        return [t for t in self._targets.values() if t.name == name]
+        return list(self._by_name.get(name, ()))
 
     def find_by_id(self, target_id: str) -> Optional[TargetInfo]:
         """Find a target by its ID."""
@@ -89,7 +200,7 @@ class TargetRegistry:
 
     def find_by_kind(self, kind: TargetKind) -> List[TargetInfo]:
         """Find targets by their kind."""
-        return [t for t in self._targets.values() if t.kind == kind]
+        return list(self._by_kind.get(kind, ()))
 
     def all_targets(self) -> List[TargetInfo]:
         """Get all registered targets."""
@@ -97,22 +208,27 @@ class TargetRegistry:
 
     def unregister(self, target_id: str) -> bool:
         """Unregister a target by its ID."""
-        if target_id in self._targets:
-            del self._targets[target_id]
-            return True
-        return False
+        target = self._targets.pop(target_id, None)
+        if target is None:
+            return False
+        _remove_indexed(self._by_name, target.name, target)
+        _remove_indexed(self._by_kind, target.kind, target)
+        return True
 
     def to_list(self, keep_keys: Optional[List[str]] = None) -> List[Dict[str, Any]]:
         """Convert the registered targets to a list of dictionaries."""
         if keep_keys:
-            return [
-                {k: v for k, v in t.model_dump().items() if k in keep_keys}
-                for t in self._targets.values()
-            ]
+            keys = frozenset(keep_keys)
+            # Kept fields in declaration order, resolved once per call, so
+            # each plain target is projected without a full dump.
+            fields = [k for k in TargetInfo.model_fields if k in keys]
+            return [_project_target(t, fields, keys) for t in self._targets.values()]
         else:
-            return [t.model_dump() for t in self._targets.values()]
+            return [_dump_target(t) for t in self._targets.values()]
 
     def clear(self) -> None:
         """Clear all registered targets."""
         self._targets.clear()
+        self._by_name.clear()
+        self._by_kind.clear()
         self._counter = 0
@@ -9,7 +9,10 @@ def test_default_config():
     assert cfg.input_text_api == "type_keys"
     assert cfg.input_text_enter is False
     assert cfg.input_text_inter_key_pause == 0.05
+    assert cfg.paste_threshold == 32
     assert cfg.pyautogui_failsafe is False
+    assert cfg.pyautogui_pause == 0.0
+    assert cfg.disable_double_click_guard is False
 
 
 def test_configure():
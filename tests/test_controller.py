@@ -0,0 +1,204 @@
+"""Tests for ControlReceiver helpers that run without a desktop."""
+
+import threading
+
+import pytest
+
+import winactions.control.controller as controller
+from winactions.control.controller import ControlReceiver
+
+
+class _FailingPyAutoGUI:
+    class FailSafeException(Exception):
+        pass
+
+    def __init__(self):
+        self.started = threading.Event()
+
+    def moveTo(self, x, y, duration=0.0):
+        self.started.set()
+        raise self.FailSafeException(f"corner at {x},{y}")
+
+
+def test_sync_mouse_reraises_move_error(monkeypatch):
+    fake = _FailingPyAutoGUI()
+    monkeypatch.setattr(controller, "pyautogui", fake, raising=False)
+    receiver = ControlReceiver(None, None)
+    monkeypatch.setattr(receiver, "transform_point", lambda x, y: (0, 0))
+
+    receiver.mouse_move({"x": 0, "y": 0})
+    assert fake.started.wait(5)
+    with pytest.raises(_FailingPyAutoGUI.FailSafeException):
+        ControlReceiver.sync_mouse()
+    ControlReceiver.sync_mouse()  # reported once, then cleared
+
+
+class _FakeWindow:
+    def __init__(self, handle):
+        self.handle = handle
+        self.focus_calls = 0
+
+    def set_focus(self):
+        self.focus_calls += 1
+
+
+def test_app_focus_skipped_across_receivers(monkeypatch):
+    foreground = {"hwnd": 0}
+
+    class _FakeWin32Gui:
+        @staticmethod
+        def GetForegroundWindow():
+            return foreground["hwnd"]
+
+    monkeypatch.setattr(controller, "win32gui", _FakeWin32Gui)
+    monkeypatch.setattr(ControlReceiver, "_focused_hwnd", None)
+    app = _FakeWindow(0x1234)
+
+    ControlReceiver(None, app)
+    foreground["hwnd"] = app.handle
+    ControlReceiver(None, app)  # one receiver per command
+    ControlReceiver(None, app)
+    assert app.focus_calls == 1
+
+    foreground["hwnd"] = 0x9999  # user switched windows
+    ControlReceiver(None, app)
+    assert app.focus_calls == 2
+
+
+class _FakeEdit:
+    def __init__(self):
+        self.sent = []
+
+    def set_focus(self):
+        pass
+
+    def has_keyboard_focus(self):
+        return True
+
+    def is_enabled(self):
+        return True
+
+    def type_keys(self, keys, **kwargs):
+        self.sent.append(keys)
+        return "typed"
+
+
+class _FakeClipboard:
+    """win32clipboard stand-in; OpenClipboard fails once *busy_after* opens."""
+
+    class error(Exception):
+        pass
+
+    def __init__(self, text="saved", busy_after=None, formats=(13,)):
+        self.text = text
+        self.formats = list(formats)
+        self.opens = 0
+        self.busy_after = busy_after
+
+    def OpenClipboard(self):
+        if self.busy_after is not None and self.opens >= self.busy_after:
+            raise self.error("clipboard is held by another process")
+        self.opens += 1
+
+    def CloseClipboard(self):
+        pass
+
+    def EnumClipboardFormats(self, fmt):
+        order = self.formats + [0]
+        return order[0] if fmt == 0 else order[order.index(fmt) + 1]
+
+    def GetClipboardData(self, fmt):
+        return self.text
+
+    def EmptyClipboard(self):
+        self.text = None
+
+    def SetClipboardData(self, fmt, text):
+        self.text = text
+
+
+class _FakeWin32Con:
+    CF_TEXT = 1
+    CF_OEMTEXT = 7
+    CF_UNICODETEXT = 13
+    CF_LOCALE = 16
+
+
+def _paste_receiver(monkeypatch, clipboard):
+    monkeypatch.setattr(controller, "win32clipboard", clipboard, raising=False)
+    monkeypatch.setattr(controller, "win32con", _FakeWin32Con, raising=False)
+    monkeypatch.setattr(ControlReceiver, "_focused_control", None)
+    edit = _FakeEdit()
+    receiver = ControlReceiver(edit, None)
+    receiver._paste_threshold = 4
+    receiver._input_text_enter = False
+    return receiver, edit
+
+
+def test_busy_clipboard_falls_back_to_typing(monkeypatch):
+    clipboard = _FakeClipboard(busy_after=0)
+    receiver, edit = _paste_receiver(monkeypatch, clipboard)
+    assert receiver.set_edit_text({"text": "long literal text"}) == "typed"
+    assert edit.sent == ["long literal text"]
+
+
+def test_clipboard_restore_failure_keeps_paste_result(monkeypatch):
+    clipboard = _FakeClipboard(busy_after=1)
+    receiver, edit = _paste_receiver(monkeypatch, clipboard)
+    assert receiver.set_edit_text({"text": "long literal text"}) == "typed"
+    assert edit.sent == ["^v"]
+
+
+def test_paste_restores_text_clipboard(monkeypatch):
+    clipboard = _FakeClipboard(formats=(13, 16, 1, 7))
+    receiver, edit = _paste_receiver(monkeypatch, clipboard)
+    receiver.set_edit_text({"text": "long literal text"})
+    assert edit.sent == ["^v"]
+    assert clipboard.text == "saved"
+
+
+def test_non_text_clipboard_is_left_alone(monkeypatch):
+    clipboard = _FakeClipboard(formats=(13, 49161))  # text + rich text
+    receiver, edit = _paste_receiver(monkeypatch, clipboard)
+    receiver.set_edit_text({"text": "long literal text"})
+    assert edit.sent == ["long literal text"]
+    assert clipboard.text == "saved"
+
+
+def test_key_names_are_typed_not_pasted(monkeypatch):
+    clipboard = _FakeClipboard()
+    receiver, edit = _paste_receiver(monkeypatch, clipboard)
+    receiver.set_edit_text({"text": "search term here{ENTER}"})
+    assert edit.sent == ["search term here{ENTER}"]  # {ENTER} stays a key
+    assert clipboard.opens == 0
+
+
+class _ClosedWindow:
+    def process_id(self):
+        raise controller.psutil.NoSuchProcess(0)
+
+
+class _BusyWindow:
+    def process_id(self):
+        import os
+        return os.getpid()
+
+
+def test_wait_idle_falls_back_to_sleep_when_process_unknown(monkeypatch):
+    from winactions.control.controller import WaitCommand
+
+    slept = []
+    monkeypatch.setattr(controller.time, "sleep", slept.append)
+    command = WaitCommand(ControlReceiver(None, None), {"timeout": 0.5})
+    command.receiver.application = _ClosedWindow()
+    assert "unavailable" in command.execute()
+    assert slept == [0.5]
+
+
+def test_wait_idle_reports_timeout(monkeypatch):
+    from winactions.control.controller import WaitCommand
+
+    monkeypatch.setattr(controller, "_IDLE_CPU_PERCENT", -1.0)  # never idle
+    command = WaitCommand(ControlReceiver(None, None), {"timeout": 0.1})
+    command.receiver.application = _BusyWindow()
+    assert command.execute() == "Timed out after 0.1s waiting for idle."
@@ -1,5 +1,7 @@
 """Basic import tests — verify the package structure is correct."""
 
+import pytest
+
 
 def test_version():
     from winactions._version import __version__
@@ -39,3 +41,62 @@ def test_command_registry_populated():
     assert "click_input" in registry
     assert "set_edit_text" in registry
     assert "keyboard_input" in registry
+
+
+def test_command_registry_rejects_duplicate_names():
+    """Registering a second class under an existing name should fail."""
+    from winactions import ControlReceiver
+    from winactions.control.controller import ControlCommand
+
+    class DuplicateClick(ControlCommand):
+        def execute(self):
+            pass
+
+        @classmethod
+        def name(cls) -> str:
+            return "click_input"
+
+    with pytest.raises(ValueError):
+        ControlReceiver.register(DuplicateClick)
+    assert ControlReceiver._command_registry["click_input"] is not DuplicateClick
+
+
+def test_receiver_subclass_gets_own_registry():
+    """A receiver subclass must not register into its parent's registry."""
+    from winactions import ControlReceiver
+    from winactions.command.basic import ReceiverBasic
+
+    class ChildReceiver(ControlReceiver):
+        pass
+
+    assert ChildReceiver._command_registry == {}
+    assert ChildReceiver._command_registry is not ControlReceiver._command_registry
+    assert ControlReceiver._command_registry is not ReceiverBasic._command_registry
+
+
+def test_receiver_subclass_registers_and_looks_up_its_commands():
+    """Subclass lookups see its own commands plus the inherited ones."""
+    from winactions import ControlReceiver
+    from winactions.control.controller import ControlCommand
+
+    class ChildReceiver(ControlReceiver):
+        pass
+
+    parent_names = ControlReceiver(None, None).supported_command_names
+    child = ChildReceiver(None, None)
+    assert child.supported_command_names == parent_names
+
+    @ChildReceiver.register
+    class ChildOnly(ControlCommand):
+        def execute(self):
+            pass
+
+        @classmethod
+        def name(cls) -> str:
+            return "child_only"
+
+    assert child.command_registry["child_only"] is ChildOnly
+    assert child.command_registry["click_input"] is ControlReceiver._command_registry["click_input"]
+    assert "child_only" in child.supported_command_names
+    assert "child_only" not in ControlReceiver(None, None).command_registry
+    assert ControlReceiver(None, None).supported_command_names == parent_names
@@ -0,0 +1,105 @@
+"""Tests for models module."""
+
+import json
+
+from winactions.models import (
+    ActionCommandInfo,
+    ListActionCommandInfo,
+    Result,
+    ResultStatus,
+)
+from winactions.targets import TargetInfo, TargetKind
+
+
+def test_result_status_coerced_from_string():
+    r = Result(status="success")
+    assert r.status is ResultStatus.SUCCESS
+    assert r.as_dict() == {"status": ResultStatus.SUCCESS, "error": None, "result": None}
+
+
+def test_action_command_info_as_dict_round_trip():
+    action = ActionCommandInfo(
+        function="click_input",
+        arguments={"button": "left"},
+        target=TargetInfo(kind=TargetKind.CONTROL, name="Save", id="3"),
+    )
+    assert action.action_string == "click_input(button='left')"
+    assert action.result.status is ResultStatus.NONE
+
+    data = action.as_dict()
+    assert data["target"]["name"] == "Save"
+    assert data["result"]["status"] == "none"
+    assert ActionCommandInfo.from_dict(data) == action
+
+    assert action.as_dict(include={"function", "arguments"}) == {
+        "function": "click_input",
+        "arguments": {"button": "left"},
+    }
+
+
+def test_as_dict_does_not_alias_arguments_or_payload():
+    action = ActionCommandInfo(
+        function="click_input",
+        arguments={"button": "left"},
+        result=Result(status="success", result={"clicked": True}),
+    )
+    data = action.as_dict()
+    data["arguments"]["repeat"] = 2
+    data["result"]["result"]["clicked"] = False
+    action.as_dict(include={"arguments"})["arguments"]["x"] = 1
+    (listed,) = ListActionCommandInfo([action]).to_list_of_dicts()
+    listed["arguments"]["y"] = 1
+    assert action.arguments == {"button": "left"}
+    assert action.result.result == {"clicked": True}
+
+
+def test_to_list_of_dicts_counts_repeats():
+    action = ActionCommandInfo(function="type", arguments={"text": "a"})
+    actions = ListActionCommandInfo([action])
+    previous = [
+        {"function": "click_input", "arguments": {}},
+        {"function": "type", "arguments": {"text": "a"}},
+        ActionCommandInfo(function="type", arguments={"text": "a"}),
+    ]
+    (out,) = actions.to_list_of_dicts(
+        keep_keys=["function"], previous_actions=previous
+    )
+    assert out == {"function": "type", "repeat_time": 2}
+
+
+def test_to_string_is_json():
+    actions = ListActionCommandInfo(
+        [ActionCommandInfo(function="type", arguments={"text": "é"})]
+    )
+    (out,) = json.loads(actions.to_string())
+    assert out["function"] == "type"
+    assert out["arguments"] == {"text": "é"}
+    assert "é" in actions.to_string()
+
+
+def test_to_string_same_with_and_without_orjson(monkeypatch):
+    import winactions.models as models
+
+    actions = ListActionCommandInfo(
+        [ActionCommandInfo(function="type", arguments={"text": "é", 1: [1.5, None]})]
+    )
+    fast = actions.to_string()
+    monkeypatch.setattr(models, "orjson", None)
+    assert actions.to_string() == fast
+
+
+def test_action_string_tracks_arguments():
+    action = ActionCommandInfo(function="type", arguments={"text": "a"})
+    action.arguments["text"] = "b"
+    assert action.action_string == "type(text='b')"
+
+
+def test_status_follows_last_successful_action():
+    assert ListActionCommandInfo().status == "FINISH"
+
+    failed = ActionCommandInfo(status="FINISH", result=Result(status="failure"))
+    assert ListActionCommandInfo([failed]).status == "CONTINUE"
+
+    first = ActionCommandInfo(status="CONTINUE", result=Result(status="success"))
+    last = ActionCommandInfo(status="FINISH", result=Result(status="success"))
+    assert ListActionCommandInfo([first, last, failed]).status == "FINISH"
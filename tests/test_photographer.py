@@ -0,0 +1,58 @@
+"""Tests for PhotographerFacade's TargetInfo helpers."""
+
+from winactions.screenshot.photographer import PhotographerFacade
+from winactions.targets import TargetInfo, TargetKind
+
+
+def _target(name, rect=None):
+    return TargetInfo(kind=TargetKind.CONTROL, name=name, rect=rect)
+
+
+def test_merge_target_info_list_matches_pairwise_iou():
+    main = [_target("a", [0, 0, 100, 100]), _target("b", [200, 0, 300, 40])]
+    extras = [
+        _target("dup", [10, 10, 100, 100]),
+        _target("beside-b", [300, 0, 340, 40]),
+        _target("in-b", [210, 5, 290, 35]),
+        _target("rectless"),
+    ]
+    merged = PhotographerFacade.merge_target_info_list(main, extras, 0.1)
+
+    expected = main + [
+        e for e in extras
+        if not any(PhotographerFacade.target_info_iou(e, m) > 0.1 for m in main)
+    ]
+    assert merged == expected
+    assert [t.name for t in merged] == ["a", "b", "beside-b", "rectless"]
+
+
+def test_target_info_iou():
+    iou = PhotographerFacade.target_info_iou
+    assert iou(_target("a", [0, 0, 10, 10]), _target("b", [5, 0, 15, 10])) == 50 / 150
+    assert iou(_target("a", [0, 0, 10, 10]), _target("b", [10, 0, 20, 10])) == 0.0
+    assert iou(_target("a", [0, 0, 10, 10]), _target("b")) == 0.0
+
+
+def test_rescale_image_letterboxes_to_scaler():
+    from PIL import Image
+
+    from winactions.screenshot.photographer import Photographer
+
+    same_aspect = Photographer.rescale_image(Image.new("RGBA", (200, 100), "red"), [100, 50])
+    assert same_aspect.size == (100, 50) and same_aspect.mode == "RGB"
+
+    boxed = Photographer.rescale_image(Image.new("RGB", (100, 100), "red"), [200, 100])
+    assert boxed.size == (200, 100)
+    assert boxed.getpixel((50, 50)) == (255, 0, 0)
+    assert boxed.getpixel((150, 50)) == (0, 0, 0)
+
+
+def test_facade_is_a_singleton():
+    assert PhotographerFacade() is PhotographerFacade()
+    assert PhotographerFacade().screenshot_factory is not None
+
+
+def test_prewarm_tolerates_missing_font():
+    from winactions.screenshot.photographer import AnnotationDecorator
+
+    AnnotationDecorator.prewarm(label_count=2)  # arial.ttf only exists on Windows
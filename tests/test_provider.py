@@ -0,0 +1,62 @@
+"""Tests for the IOU merge helpers in perception.provider."""
+
+from winactions.perception.provider import (
+    CompositeStateProvider,
+    _iou,
+    _merge_by_iou_with_controls,
+    merge_by_iou,
+)
+from winactions.targets import TargetInfo, TargetKind
+
+
+def _target(name, rect=None):
+    return TargetInfo(kind=TargetKind.CONTROL, name=name, rect=rect)
+
+
+def test_iou():
+    assert _iou([0, 0, 10, 10], [0, 0, 10, 10]) == 1.0
+    assert _iou([0, 0, 10, 10], [5, 0, 15, 10]) == 50 / 150
+    assert _iou([0, 0, 10, 10], [10, 0, 20, 10]) == 0.0
+    assert _iou([0, 0, 10, 10], [20, 20, 30, 30]) == 0.0
+    assert _iou([0, 0, 0, 0], [0, 0, 0, 0]) == 0.0
+
+
+def test_merge_by_iou_drops_overlapping_extras():
+    main = [_target("a", [0, 0, 100, 100]), _target("no-rect")]
+    extras = [
+        _target("dup", [5, 5, 100, 100]),
+        _target("far", [500, 500, 600, 600]),
+        _target("edge", [100, 0, 200, 100]),
+        _target("rectless"),
+    ]
+    merged = merge_by_iou(main, extras, threshold=0.1)
+    assert [t.name for t in merged] == ["a", "no-rect", "far", "edge", "rectless"]
+
+
+def test_merge_with_controls_keeps_lists_in_lockstep():
+    main = [_target("a", [0, 0, 100, 100])]
+    extras = [_target("dup", [0, 0, 90, 90]), _target("far", [300, 0, 400, 50])]
+    controls = ["ctrl-a"]
+    _merge_by_iou_with_controls(main, controls, extras, [None, None], threshold=0.1)
+    assert [t.name for t in main] == ["a", "far"]
+    assert controls == ["ctrl-a", None]
+
+
+class _FakeProvider:
+    def __init__(self, targets, controls):
+        self.result = (targets, controls)
+
+    def detect(self, window):
+        return self.result
+
+
+def test_composite_merges_in_provider_order_and_reids():
+    primary = _FakeProvider([_target("a", [0, 0, 100, 100])], ["ctrl-a"])
+    vision = _FakeProvider(
+        [_target("dup", [0, 0, 95, 95]), _target("far", [300, 0, 400, 50])],
+        [None, None],
+    )
+    extra = _FakeProvider([_target("grip", [500, 0, 510, 10])], [None])
+    targets, controls = CompositeStateProvider(primary, vision, extra).detect(None)
+    assert [(t.id, t.name) for t in targets] == [("1", "a"), ("2", "far"), ("3", "grip")]
+    assert controls == ["ctrl-a", None, None]
@@ -63,6 +63,27 @@ class TestSessionDispatch:
         assert resp["status"] == "error"
         assert "Unknown command" in resp["error"]
 
+    def test_batch_runs_in_order(self):
+        dispatch, _ = self._make_dispatch()
+        resp = dispatch.handle({"batch": [
+            {"command": "_ping"},
+            {"command": "nonexistent"},
+            {"command": "_shutdown"},
+            {"command": "windows"},
+        ]})
+        assert resp["status"] == "ok"
+        assert [r["status"] for r in resp["results"]] == ["ok", "error", "error", "ok"]
+        assert "cannot be batched" in resp["results"][2]["error"]
+
+    def test_batch_stop_on_error(self):
+        dispatch, session = self._make_dispatch()
+        resp = dispatch.handle({
+            "batch": [{"command": "nonexistent"}, {"command": "windows"}],
+            "stop_on_error": True,
+        })
+        assert len(resp["results"]) == 1
+        session.list_windows.assert_not_called()
+
     def test_windows(self):
         dispatch, session = self._make_dispatch()
         resp = dispatch.handle({"command": "windows"})
@@ -225,6 +246,13 @@ class TestKeyTranslation:
         assert _translate_keys("^a") == "^a"
         assert _translate_keys("{ENTER}") == "{ENTER}"
 
+    def test_repeated_combo_served_from_cache(self):
+        from winactions.cli.session_dispatch import _translate_keys
+        _translate_keys("ctrl+shift+s")
+        hits = _translate_keys.cache_info().hits
+        assert _translate_keys("ctrl+shift+s") == "^+s"
+        assert _translate_keys.cache_info().hits == hits + 1
+
 
 # ======================================================================
 # Protocol / JSON round-trip tests
@@ -264,6 +292,43 @@ class TestProtocol:
         decoded = json.loads(encoded.decode("utf-8").strip())
         assert decoded["status"] == "error"
 
+    def test_frame_encoding_matches_stdlib(self, monkeypatch):
+        from winactions.cli import session_server
+
+        response = {
+            "status": "ok",
+            "result": "Typed \u00e9",
+            "state": {"targets": [{"id": "1", "rect": [0, 0, 5, 5]}]},
+        }
+        fast = session_server._json_dumps_line(response)
+        monkeypatch.setattr(session_server, "orjson", None)
+        plain = session_server._json_dumps_line(response)
+
+        for frame in (fast, plain):
+            assert frame.endswith(b"\n") and frame.count(b"\n") == 1
+            assert json.loads(frame) == response
+            assert session_server._json_loads(frame[:-1]) == response
+
+
+    def test_recv_line_large_and_split_frames(self):
+        from winactions.cli.session_server import _recv_line
+
+        payload = b"x" * 200_000  # several buffer growths
+        a, b = socket.socketpair()
+        with a, b:
+            sender = threading.Thread(
+                target=a.sendall, args=(payload + b"\nnext",)
+            )
+            sender.start()
+            assert _recv_line(b, timeout=5.0) == payload
+            sender.join()
+
+        a, b = socket.socketpair()
+        with a, b:
+            a.sendall(b'{"status": "ok"}')
+            a.shutdown(socket.SHUT_WR)
+            assert _recv_line(b, timeout=5.0) == b'{"status": "ok"}'
+
 
 # ======================================================================
 # Server port + PID file tests
@@ -282,7 +347,7 @@ class TestServerLifecycle:
         from winactions.cli.session_server import session_port
         p1 = session_port("outlook")
         p2 = session_port("notepad")
-        # Very unlikely to collide with SHA256
+        # Very unlikely to collide across the 16384-port range
         assert p1 != p2
 
     def test_pid_file_write_read(self):
@@ -305,6 +370,49 @@ class TestServerLifecycle:
         from winactions.cli.session_server import read_pid_file
         assert read_pid_file("_nonexistent_session_xyz") is None
 
+    def test_is_server_alive_stale_pid_file(self):
+        from winactions.cli.session_server import (
+            is_server_alive, write_pid_file, pid_file_path, remove_pid_file,
+        )
+        name = f"_test_stale_{os.getpid()}"
+        # Reserve a free port, then release it so nothing is listening
+        sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        sock.bind(("127.0.0.1", 0))
+        port = sock.getsockname()[1]
+        sock.close()
+        try:
+            write_pid_file(name, port)
+            assert is_server_alive(name) is False
+            assert not os.path.exists(pid_file_path(name))
+        finally:
+            remove_pid_file(name)
+
+    def test_is_server_alive_non_dict_reply(self):
+        from winactions.cli.session_server import (
+            is_server_alive, write_pid_file, pid_file_path, remove_pid_file,
+        )
+        name = f"_test_nondict_{os.getpid()}"
+        listener = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        listener.bind(("127.0.0.1", 0))
+        listener.listen(1)
+
+        def reply_with_list():
+            conn, _ = listener.accept()
+            with conn:
+                conn.recv(1024)
+                conn.sendall(b"[]\n")
+
+        t = threading.Thread(target=reply_with_list, daemon=True)
+        t.start()
+        try:
+            write_pid_file(name, listener.getsockname()[1])
+            assert is_server_alive(name) is False
+            assert not os.path.exists(pid_file_path(name))
+        finally:
+            t.join(timeout=5)
+            listener.close()
+            remove_pid_file(name)
+
     def test_remove_pid_file_no_error(self):
         from winactions.cli.session_server import remove_pid_file
         # Should not raise even if file doesn't exist
@@ -549,7 +657,7 @@ class TestServerClientIntegration:
         """Verify multiple requests reuse the same server."""
         from winactions.cli.session_dispatch import SessionDispatch
         from winactions.cli.session_server import SessionServer
-        from winactions.cli.session_client import send_command
+        from winactions.cli.session_client import send_command, send_command_batch
 
         session = MagicMock()
         session.window = MagicMock()
@@ -579,6 +687,11 @@ class TestServerClientIntegration:
 
             r3 = send_command(port, {"command": "_ping"})
             assert r3["status"] == "ok"
+
+            r4 = send_command_batch(port, [{"command": "_ping"}, {"command": "windows"}])
+            assert r4["status"] == "ok"
+            assert [r["status"] for r in r4["results"]] == ["ok", "ok"]
+            assert r4["results"][1]["result"] == [{"id": "1", "title": "T"}]
         finally:
             send_command(port, {"command": "_shutdown"}, timeout=2.0)
             t.join(timeout=5)
@@ -627,3 +740,33 @@ class TestProviderSwitching:
                 "flags": {"vision": True},
             })
             mock_rebuild.assert_called_once_with(True, False)
+
+    def test_flipping_back_reuses_built_provider(self):
+        from winactions.cli.session_dispatch import SessionDispatch
+
+        session = MagicMock()
+        original = session.provider
+        dispatch = SessionDispatch(session, default_vision=False, default_infer=False)
+        built = MagicMock()
+
+        with patch.object(dispatch, "_build_provider", return_value=built) as mock_build:
+            dispatch._rebuild_provider(True, False)
+            assert session.provider is built
+            dispatch._rebuild_provider(False, False)
+            assert session.provider is original
+            dispatch._rebuild_provider(True, False)
+            assert session.provider is built
+            mock_build.assert_called_once_with(True, False)
+        assert session.state is None
+
+    def test_empty_flags_revert_to_defaults(self):
+        from winactions.cli.session_dispatch import SessionDispatch
+
+        session = MagicMock()
+        dispatch = SessionDispatch(session, default_vision=False, default_infer=False)
+
+        with patch.object(dispatch, "_rebuild_provider") as mock_rebuild:
+            dispatch._maybe_switch_provider({"vision": True})
+            dispatch._maybe_switch_provider({})
+            dispatch._maybe_switch_provider({})
+        assert [c.args for c in mock_rebuild.call_args_list] == [(True, False), (False, False)]
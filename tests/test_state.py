@@ -0,0 +1,34 @@
+"""Tests for UIState serialization."""
+
+import json
+
+from winactions.perception.state import UIState
+from winactions.targets import TargetInfo, TargetKind
+
+
+def _state():
+    targets = [
+        TargetInfo(kind=TargetKind.CONTROL, id="1", name="Save", type="Button",
+                   rect=[0, 0, 10, 10]),
+        TargetInfo(kind=TargetKind.CONTROL, id="2", name="Border", type="Splitter",
+                   rect=[10, 0, 14, 10]),
+    ]
+    return UIState(
+        window_title="Editor", window_handle=42, process_name="editor.exe",
+        targets=targets, control_map={"1": object()}, timestamp="t",
+    )
+
+
+def test_to_json_includes_rect_only_when_needed():
+    state = _state()
+    assert state.to_json()["targets"] == [
+        {"id": "1", "name": "Save", "type": "Button"},
+        {"id": "2", "name": "Border", "type": "Splitter", "rect": [10, 0, 14, 10]},
+    ]
+    assert state.to_json(verbose=True)["targets"][0]["rect"] == [0, 0, 10, 10]
+
+
+def test_to_json_bytes_matches_to_json():
+    state = _state()
+    assert json.loads(state.to_json_bytes()) == state.to_json()
+    assert json.loads(state.to_json_bytes(verbose=True)) == state.to_json(verbose=True)
@@ -0,0 +1,91 @@
+"""Tests for StructuralInferenceProvider's offline pieces (no LLM calls)."""
+
+from winactions.perception.structural_provider import StructuralInferenceProvider
+from winactions.targets import TargetInfo, TargetKind
+
+
+def _provider(calls):
+    provider = StructuralInferenceProvider(uia_provider=None, api_key="test")
+
+    def fake_call_model(uia_text):
+        calls.append(uia_text)
+        return [{"name": "border", "type": "ColumnBorder",
+                 "rect": [10, 0, 14, 20], "confidence": 0.95}]
+
+    provider._call_model = fake_call_model
+    return provider
+
+
+def test_inference_cached_by_layout():
+    calls = []
+    provider = _provider(calls)
+    header = TargetInfo(kind=TargetKind.CONTROL, id="1", name="Subject",
+                        type="HeaderItem", rect=[0, 0, 12, 20])
+
+    first = provider._infer_elements([header])
+    assert [t.type for t in first] == ["ColumnBorder"]
+
+    # Same layout and names: served from the cache
+    again = header.model_copy()
+    assert provider._infer_elements([again])[0].rect == [10, 0, 14, 20]
+    assert len(calls) == 1
+
+    moved = header.model_copy(update={"rect": [0, 0, 40, 20]})
+    provider._infer_elements([moved])
+    assert len(calls) == 2
+
+
+def test_renamed_headers_are_not_served_from_cache():
+    calls = []
+    provider = _provider(calls)
+    inbox = [
+        TargetInfo(kind=TargetKind.CONTROL, id="1", name="Subject",
+                   type="HeaderItem", rect=[0, 0, 12, 20]),
+        TargetInfo(kind=TargetKind.CONTROL, id="2", name="Date",
+                   type="HeaderItem", rect=[12, 0, 30, 20]),
+    ]
+    provider._infer_elements(inbox)
+
+    # Another view: same geometry, different columns
+    sent = [t.model_copy(update={"name": n}) for t, n in zip(inbox, ["To", "Sent"])]
+    provider._infer_elements(sent)
+    assert len(calls) == 2
+    assert '"To"' in calls[1]
+
+
+def test_unparseable_reply_is_not_cached():
+    provider = StructuralInferenceProvider(uia_provider=None, api_key="test")
+    replies = [
+        "Sorry, the reply was cut off: [{",
+        '[{"name": "border", "type": "ColumnBorder", "rect": [10, 0, 14, 20], "confidence": 0.95}]',
+    ]
+    provider._call_model = lambda uia_text: provider._parse_response(replies.pop(0))
+    header = TargetInfo(kind=TargetKind.CONTROL, id="1", name="Subject",
+                        type="HeaderItem", rect=[0, 0, 12, 20])
+
+    assert provider._infer_elements([header]) == []
+    assert [t.type for t in provider._infer_elements([header])] == ["ColumnBorder"]
+    assert replies == []
+
+
+def test_only_structural_controls_are_sent():
+    calls = []
+    provider = _provider(calls)
+    button = TargetInfo(kind=TargetKind.CONTROL, id="1", name="OK",
+                        type="Button", rect=[0, 0, 10, 10])
+    assert provider._infer_elements([button]) == []
+    assert calls == []
+
+    pane = TargetInfo(kind=TargetKind.CONTROL, id="2", name="",
+                      type="Pane", rect=[0, 0, 100, 100])
+    provider._infer_elements([button, pane])
+    assert calls == ['[2] [Pane] "" rect=[0, 0, 100, 100]']
+
+
+def test_parse_response_ignores_fences_and_trailing_text():
+    parse = StructuralInferenceProvider._parse_response
+    text = '```json\n[{"name": "a", "rect": [1, 2, 3, 4]}]\n```\nThe [1] border...'
+    assert parse(text) == [{"name": "a", "rect": [1, 2, 3, 4]}]
+    assert parse("Found: [] nothing") == []
+    assert parse('{"name": "a"}') is None
+    assert parse("no json here") is None
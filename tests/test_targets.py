@@ -38,6 +38,15 @@ def test_registry_register_and_get():
     assert registry.get("3") is None
 
 
+def test_registry_register_accepts_tuples_and_generators():
+    registry = TargetRegistry()
+    t1 = TargetInfo(kind=TargetKind.CONTROL, name="A")
+    t2 = TargetInfo(kind=TargetKind.CONTROL, name="B")
+    assert registry.register((t1,)) == [t1]
+    assert registry.register(t for t in [t2]) == [t2]
+    assert [t.id for t in registry.all_targets()] == ["1", "2"]
+
+
 def test_registry_find_by_name():
     registry = TargetRegistry()
     t = TargetInfo(kind=TargetKind.CONTROL, name="Save")
@@ -66,3 +75,83 @@ def test_registry_to_list():
     assert lst[0]["name"] == "OK"
     assert lst[0]["type"] == "Button"
     assert "id" not in lst[0]
+
+
+def test_registry_to_list_keep_keys_matches_filtered_dump():
+    registry = TargetRegistry()
+    targets = [
+        TargetInfo(kind=TargetKind.CONTROL, name="OK", type="Button", rect=[1, 2, 3, 4]),
+        TargetInfo.model_construct(kind=TargetKind.WINDOW, name="Main", id="w"),
+    ]
+    registry.register(targets)
+    keep = ["rect", "name", "missing"]
+    lst = registry.to_list(keep_keys=keep)
+    assert lst == [
+        {k: v for k, v in t.model_dump().items() if k in keep} for t in targets
+    ]
+    assert list(lst[0]) == ["name", "rect"]
+    assert lst[0]["rect"] is not targets[0].rect
+
+
+def test_registry_to_list_matches_model_dump():
+    registry = TargetRegistry()
+    targets = [
+        TargetInfo(kind=TargetKind.CONTROL, name="OK", type="Button", rect=[1, 2, 3, 4]),
+        TargetInfo.model_construct(kind=TargetKind.WINDOW, name="Main", id="w"),
+    ]
+    registry.register(targets)
+    lst = registry.to_list()
+    assert lst == [t.model_dump() for t in targets]
+    assert list(lst[0]) == list(targets[0].model_dump())
+    assert lst[0]["rect"] is not targets[0].rect
+
+
+def test_registry_name_and_kind_indexes_follow_unregister():
+    registry = TargetRegistry()
+    a = TargetInfo(kind=TargetKind.CONTROL, name="Save")
+    b = TargetInfo(kind=TargetKind.CONTROL, name="Save")
+    w = TargetInfo(kind=TargetKind.WINDOW, name="Main")
+    registry.register([a, b, w])
+
+    assert registry.find_by_name("Save") == [a, b]
+    assert registry.find_by_kind(TargetKind.WINDOW) == [w]
+
+    # a == b by value; only the unregistered instance may leave the index
+    assert registry.unregister(b.id)
+    assert registry.find_by_name("Save")[0] is a
+    assert registry.find_by_kind(TargetKind.CONTROL) == [a]
+    assert not registry.unregister(b.id)
+
+    registry.clear()
+    assert registry.find_by_name("Save") == []
+    assert registry.find_by_kind(TargetKind.WINDOW) == []
+
+
+def test_register_from_dicts_fast():
+    registry = TargetRegistry()
+    registered = registry.register_from_dicts_fast([
+        {"kind": "control", "name": "OK", "type": "Button", "rect": [0, 0, 5, 5]},
+        {"kind": TargetKind.WINDOW, "name": "Main", "id": "w"},
+    ])
+    assert [t.id for t in registered] == ["1", "w"]
+    assert registered[0].kind is TargetKind.CONTROL
+    assert registered[1].kind is TargetKind.WINDOW
+    assert registered[0] == TargetInfo(
+        kind=TargetKind.CONTROL, name="OK", id="1", type="Button", rect=[0, 0, 5, 5]
+    )
+
+
+def test_register_from_dicts_validates_batch():
+    import pytest
+    from pydantic import ValidationError
+
+    registry = TargetRegistry()
+    registered = registry.register_from_dicts([
+        {"kind": "control", "name": "OK", "rect": [0, 0, 5, 5], "extra": 1},
+        {"kind": "window", "name": "Main"},
+    ])
+    assert [(t.id, t.kind) for t in registered] == [
+        ("1", TargetKind.CONTROL), ("2", TargetKind.WINDOW),
+    ]
+    with pytest.raises(ValidationError):
+        registry.register_from_dicts([{"kind": "bogus", "name": "X"}])
@@ -0,0 +1,55 @@
+"""Tests for VisionStateProvider's offline pieces (no API calls)."""
+
+from PIL import Image
+
+from winactions.perception.vision_provider import VisionStateProvider
+
+
+def test_detections_cached_by_screenshot_pixels():
+    provider = VisionStateProvider(api_key="test")
+    calls = []
+
+    def fake_call_model(image_b64):
+        calls.append(image_b64)
+        return [{"name": "grip", "type": "ResizeHandle", "rect": [1, 2, 3, 4]}]
+
+    provider._call_model = fake_call_model
+
+    image = Image.new("RGB", (40, 30), "white")
+    assert provider._cached_call_model(image)[0]["name"] == "grip"
+    assert provider._cached_call_model(image.copy())[0]["rect"] == [1, 2, 3, 4]
+    assert len(calls) == 1
+
+    image.putpixel((5, 5), (0, 0, 0))
+    provider._cached_call_model(image)
+    assert len(calls) == 2
+
+
+def test_unparseable_reply_is_not_cached():
+    provider = VisionStateProvider(api_key="test")
+    replies = ["I could not see [", '[{"name": "grip", "rect": [1, 2, 3, 4]}]']
+    provider._call_model = lambda image_b64: provider._parse_response(replies.pop(0))
+
+    image = Image.new("RGB", (40, 30), "white")
+    assert provider._cached_call_model(image) == []
+    assert provider._cached_call_model(image)[0]["name"] == "grip"
+    assert provider._cached_call_model(image)[0]["name"] == "grip"  # now cached
+    assert replies == []
+
+
+def test_encode_image_formats():
+    image = Image.new("RGBA", (8, 8), "red")
+    png = VisionStateProvider(api_key="test")._encode_image(image)
+    assert png.startswith("iVBORw0KGgo")  # PNG signature
+    jpeg = VisionStateProvider(api_key="test", image_format="jpeg")
+    assert jpeg._media_type == "image/jpeg"
+    assert jpeg._encode_image(image).startswith("/9j/")  # JPEG SOI marker
+
+
+def test_parse_response_ignores_fences_and_trailing_text():
+    parse = VisionStateProvider._parse_response
+    text = '```json\n[{"name": "grip", "rect": [1, 2, 3, 4]}]\n```\nNote: [sic]'
+    assert parse(text) == [{"name": "grip", "rect": [1, 2, 3, 4]}]
+    assert parse("[]") == []
+    assert parse('{"name": "grip"}') is None
+    assert parse("nothing found") is None